@@ -1,5 +1,4 @@
 from src.model.Monster import Monster
-import random
 
 
 class Goblin(Monster):
@@ -7,9 +6,9 @@ class Goblin(Monster):
     Gorgon enemy - refactored from Goblin
     Simple enemy that attacks and moves
     """
-    def __init__(self):
+    def __init__(self, rng=None):
         # Initialize as Gorgon with stats from database
-        super().__init__("Gorgon", 70, 0, is_boss=False)
+        super().__init__("Gorgon", 70, 0, is_boss=False, rng=rng)
         self.__attack_speed = 1.4  # From database
         self.__movement_speed = 40.0  # Keep original movement speed
         self.__special_skill = "Snake Strike"  # Updated for Gorgon theme
@@ -25,9 +24,9 @@ class Goblin(Monster):
     def attack(self, player):
         """Gorgon attack implementation"""
         print(f"{self.get_name()} strikes with venomous fangs!")
-        if random.random() <= self.get_chance_to_hit():
+        if self._rng.random() <= self.get_chance_to_hit():
             min_damage, max_damage = self.get_damage_range()
-            damage = random.randint(min_damage, max_damage)
+            damage = self._rng.randint(min_damage, max_damage)
             player.take_damage(damage)
             return damage
         else:
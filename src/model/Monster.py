@@ -1,12 +1,16 @@
 import random
 
 class Monster:
-    def __init__(self, name: str, health: int, attack_damage: int, is_boss: bool):
+    def __init__(self, name: str, health: int, attack_damage: int, is_boss: bool, rng=None):
         self.__name = name
         self.__health = health
         self.__attack_damage = attack_damage
         self.__is_boss = is_boss
 
+        # Injectable random source so combat can be made deterministic
+        # (e.g. seeded in tests); defaults to the shared random module
+        self._rng = rng if rng is not None else random
+
         # Optional attributes you can set in subclasses
         self.__chance_to_hit = 1.0
         self.__min_damage = attack_damage
@@ -17,8 +21,8 @@ class Monster:
 
     def attack(self, player):
         """Attempt to attack the player"""
-        if random.random() <= self.__chance_to_hit:
-            damage = random.randint(self.__min_damage, self.__max_damage)
+        if self._rng.random() <= self.__chance_to_hit:
+            damage = self._rng.randint(self.__min_damage, self.__max_damage)
             player.take_damage(damage)
             return damage
         return 0
@@ -35,8 +39,8 @@ class Monster:
 
     def __try_heal(self):
         """Private method to attempt healing based on chance"""
-        if random.random() <= self.__chance_to_heal:
-            heal_amount = random.randint(self.__min_heal, self.__max_heal)
+        if self._rng.random() <= self.__chance_to_heal:
+            heal_amount = self._rng.randint(self.__min_heal, self.__max_heal)
             self.__health += heal_amount
             print(f"{self.__name} heals for {heal_amount} HP!")
 
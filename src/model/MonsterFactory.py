@@ -27,22 +27,26 @@ class MonsterFactory(ABC):
         pass
 
     @abstractmethod
-    def get_supported_types(self) -> list[MonsterType]:
-        """Get list of monster types this factory can create"""
+    def get_supported_types(self) -> frozenset[MonsterType]:
+        """Get the monster types this factory can create"""
         pass
 
 
 class DungeonMonsterFactory(MonsterFactory):
     """Concrete factory for creating dungeon monsters"""
 
+    # Built once at class level; membership checks and repeated
+    # get_supported_types calls stay O(1) with no per-call copy
+    _SUPPORTED_TYPES = frozenset({
+        MonsterType.GORGON,
+        MonsterType.SKELETON,
+        MonsterType.OGRE,
+        MonsterType.DEMON_BOSS
+    })
+
     def __init__(self):
         """Initialize the factory with supported monster types"""
-        self._supported_types = [
-            MonsterType.GORGON,
-            MonsterType.SKELETON,
-            MonsterType.OGRE,
-            MonsterType.DEMON_BOSS
-        ]
+        self._supported_types = self._SUPPORTED_TYPES
 
     def create_monster(self, monster_type: MonsterType, x: int = 0, y: int = 0) -> Union[Monster, DemonBoss]:
         """
@@ -59,22 +63,12 @@ class DungeonMonsterFactory(MonsterFactory):
         Raises:
             ValueError: If monster_type is not supported
         """
-        if monster_type not in self._supported_types:
+        builder = self._MONSTER_BUILDERS.get(monster_type)
+        if builder is None:
             raise ValueError(f"Unsupported monster type: {monster_type}. "
                              f"Supported types: {[t.value for t in self._supported_types]}")
 
-        # Use your existing classes exactly as they are
-        if monster_type == MonsterType.GORGON:
-            return self._create_gorgon()
-        elif monster_type == MonsterType.SKELETON:
-            return self._create_skeleton()
-        elif monster_type == MonsterType.OGRE:
-            return self._create_ogre()
-        elif monster_type == MonsterType.DEMON_BOSS:
-            return self._create_demon_boss(x, y)
-
-        # This should never be reached due to the validation above
-        raise ValueError(f"Factory method not implemented for {monster_type}")
+        return builder(self, x, y)
 
     def _create_gorgon(self) -> Goblin:
         """Create a Goblin using  Goblin class"""
@@ -92,9 +86,18 @@ class DungeonMonsterFactory(MonsterFactory):
         """Create a DemonBoss using DemonBoss class"""
         return DemonBoss(x, y)
 
-    def get_supported_types(self) -> list[MonsterType]:
-        """Return list of monster types this factory can create"""
-        return self._supported_types.copy()
+    # Dict-backed dispatch for create_monster: O(1) lookup instead of an
+    # if/elif chain that grows with every monster type
+    _MONSTER_BUILDERS = {
+        MonsterType.GORGON: lambda self, x, y: self._create_gorgon(),
+        MonsterType.SKELETON: lambda self, x, y: self._create_skeleton(),
+        MonsterType.OGRE: lambda self, x, y: self._create_ogre(),
+        MonsterType.DEMON_BOSS: lambda self, x, y: self._create_demon_boss(x, y),
+    }
+
+    def get_supported_types(self) -> frozenset[MonsterType]:
+        """Return the monster types this factory can create"""
+        return self._supported_types
 
     def create_random_monster(self, exclude_bosses: bool = True, x: int = 0, y: int = 0) -> Union[Monster, DemonBoss]:
         """
@@ -110,7 +113,7 @@ class DungeonMonsterFactory(MonsterFactory):
         """
         import random
 
-        available_types = self._supported_types.copy()
+        available_types = list(self._supported_types)
 
         if exclude_bosses:
             # Filter out boss monsters (monsters with isBoss = True)
@@ -19,6 +19,10 @@ class Ogre(Monster):
         self.set_heal_chance(0.1)
         self.set_heal_range(30, 60)
 
+    def reset(self):
+        """Restore the ogre to its freshly constructed state"""
+        self.__init__()
+
     def attack(self, player):
         """Attempt to attack the player"""
         print(f"{self.get_name()} uses {self.__special_skill}!")
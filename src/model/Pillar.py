@@ -11,6 +11,10 @@ class PillarType(Enum):
     ABSTRACTION = "Abstraction"
     COMPOSITION = "Composition"
 
+# Materialized once; iterating the enum class walks its metaclass on
+# every pass, and draw_collection_ui runs every frame
+_PILLAR_TYPES = tuple(PillarType)
+
 class Pillar:
     """Represents a collectible OOP concept pillar"""
 
@@ -281,7 +285,7 @@ class PillarManager:
 
         # Draw individual pillar indicators
         indicator_x = x + 150
-        for i, pillar_type in enumerate(PillarType):
+        for i, pillar_type in enumerate(_PILLAR_TYPES):
             color = (0, 255, 0) if self.has_collected(pillar_type) else (100, 100, 100)
             indicator_rect = pygame.Rect(indicator_x + i * 20, y + 10, 10, 10)
             pygame.draw.rect(surface, color, indicator_rect)
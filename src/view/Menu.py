@@ -5,6 +5,8 @@ import time
 from typing import Optional, List, Dict, Tuple
 import sqlite3
 
+from src.view.SaveCodec import dump_save, load_save, unwrap_payload
+
 class Button:
     """Encapsulated button class for menu interfaces"""
     
@@ -135,24 +137,19 @@ class GameStateManager:
             safe_name = self.__sanitize_filename(save_name)
             if not safe_name:
                 return False
-                
-            import pickle
-            import hashlib
-            
-            # Add metadata
-            game_state['__meta'] = {
-                'timestamp': pygame.time.get_ticks(),
-                'version': '1.0'
+
+            # Wrap state and metadata together and write through the
+            # shared codec so SaveGameMenu can read the result
+            payload = {
+                'data': game_state,
+                'meta': {
+                    'timestamp': time.time(),
+                    'version': '1.0'
+                }
             }
-            
-            # Generate checksum for integrity verification
-            state_bytes = pickle.dumps(game_state)
-            checksum = hashlib.sha256(state_bytes).hexdigest()
-            
-            # Save file with checksum
             with open(os.path.join(self.__save_dir, f"{safe_name}.save"), 'wb') as f:
-                pickle.dump({'checksum': checksum, 'data': game_state}, f)
-                
+                dump_save(f, payload)
+
             return True
         except Exception:
             return False
@@ -172,31 +169,21 @@ class GameStateManager:
             safe_name = self.__sanitize_filename(save_name)
             if not safe_name:
                 return None
-                
-            import pickle
-            import hashlib
-            
+
             # Load save file
             save_path = os.path.join(self.__save_dir, f"{safe_name}.save")
             if not os.path.exists(save_path):
                 return None
-                
+
+            # Decode through the shared codec, which handles every
+            # format this game has ever written
             with open(save_path, 'rb') as f:
-                save_data = pickle.load(f)
-                
-            # Verify checksum for integrity
-            stored_checksum = save_data.get('checksum')
-            game_state = save_data.get('data')
-            
-            if not stored_checksum or not game_state:
-                return None
-                
-            # Verify integrity
-            calculated_checksum = hashlib.sha256(pickle.dumps(game_state)).hexdigest()
-            if calculated_checksum != stored_checksum:
+                payload, valid = load_save(f)
+
+            if not valid:
                 return None  # Data integrity issue
-                
-            return game_state
+
+            return unwrap_payload(payload)
         except Exception:
             return None
     
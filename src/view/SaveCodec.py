@@ -0,0 +1,133 @@
+"""Shared save-file codec.
+
+SaveGameMenu (in-game pause menu) and GameStateManager (main menu) read
+and write the same saves/ directory, so the on-disk format lives here
+and both go through dump_save/load_save rather than keeping two copies
+of the layout in sync.
+"""
+import hashlib
+import io
+import pickle
+
+# Optional zstd support for compressed save files
+try:
+    from compression import zstd  # Python 3.14+
+except ImportError:
+    try:
+        import zstandard as zstd
+    except ImportError:
+        zstd = None
+
+# Magic bytes identifying the save file format:
+#   DAZ1 - sha256 digest + zstd-compressed pickle (legacy)
+#   DAS2 - blake2b-16 digest + raw pickle
+#   DAZ2 - blake2b-16 digest + zstd-compressed pickle
+ZSTD_SAVE_MAGIC = b'DAZ1'
+SAVE_MAGIC_RAW = b'DAS2'
+SAVE_MAGIC_ZSTD = b'DAZ2'
+
+# BLAKE2b is ~2x faster than SHA-256 for pure integrity checking
+SAVE_DIGEST_SIZE = 16
+
+
+class UnsupportedSaveError(Exception):
+    """Raised when a save file needs zstd support that is unavailable"""
+
+
+def _save_digest(state_bytes: bytes) -> bytes:
+    """Compute the integrity digest for a save file's pickled bytes"""
+    return hashlib.blake2b(state_bytes, digest_size=SAVE_DIGEST_SIZE).digest()
+
+
+def dump_save(f, payload):
+    """Write a save payload to an open binary file in the current format
+
+    Args:
+        f: Writable binary file object
+        payload: Picklable save payload
+    """
+    # Serialize once into a reusable buffer; getbuffer() hands the
+    # hash and write a memoryview with no extra bytes copy
+    buf = io.BytesIO()
+    pickle.Pickler(buf, protocol=pickle.HIGHEST_PROTOCOL).dump(payload)
+    state_bytes = buf.getbuffer()
+    digest = _save_digest(state_bytes)
+    if zstd is not None:
+        f.write(SAVE_MAGIC_ZSTD)
+        f.write(digest)
+        f.write(zstd.compress(state_bytes, level=3))
+    else:
+        f.write(SAVE_MAGIC_RAW)
+        f.write(digest)
+        f.write(state_bytes)
+
+
+def load_save(f):
+    """Read a save file in any format this game has ever written
+
+    Args:
+        f: Readable binary file object positioned at the start
+
+    Returns:
+        Tuple of (payload, checksum_ok)
+
+    Raises:
+        UnsupportedSaveError: If the file is zstd-compressed and no
+            zstd module is available
+    """
+    magic = f.read(4)
+    if magic in (SAVE_MAGIC_ZSTD, ZSTD_SAVE_MAGIC) and zstd is None:
+        raise UnsupportedSaveError("save file requires zstd support")
+
+    if magic == SAVE_MAGIC_ZSTD:
+        digest = f.read(SAVE_DIGEST_SIZE)
+        state_bytes = zstd.decompress(f.read())
+        valid = _save_digest(state_bytes) == digest
+    elif magic == SAVE_MAGIC_RAW:
+        digest = f.read(SAVE_DIGEST_SIZE)
+        state_bytes = f.read()
+        valid = _save_digest(state_bytes) == digest
+    elif magic == ZSTD_SAVE_MAGIC:
+        digest = f.read(hashlib.sha256().digest_size)
+        state_bytes = zstd.decompress(f.read())
+        valid = hashlib.sha256(state_bytes).digest() == digest
+    else:
+        # Legacy saves, oldest first: the original format is a bare
+        # pickled {'checksum': hexdigest, 'data': state} dict; a
+        # short-lived interim layout wrote a raw sha256 digest
+        # followed by the pickle
+        f.seek(0)
+        raw = f.read()
+        try:
+            legacy = pickle.loads(raw)
+        except Exception:
+            legacy = None
+        if isinstance(legacy, dict) and 'checksum' in legacy and 'data' in legacy:
+            # Both legacy writers checksummed a re-pickle of the state,
+            # but at different pickle protocols; accept either
+            data = legacy['data']
+            valid = legacy['checksum'] in (
+                hashlib.sha256(pickle.dumps(data)).hexdigest(),
+                hashlib.sha256(
+                    pickle.dumps(data, protocol=pickle.HIGHEST_PROTOCOL)
+                ).hexdigest(),
+            )
+            return data, valid
+        else:
+            digest_size = hashlib.sha256().digest_size
+            digest = raw[:digest_size]
+            state_bytes = raw[digest_size:]
+            valid = hashlib.sha256(state_bytes).digest() == digest
+
+    return pickle.loads(state_bytes), valid
+
+
+def unwrap_payload(payload):
+    """Extract the game state dict from a decoded save payload
+
+    Current saves wrap the state as {'data': state, 'meta': {...}};
+    older saves stored the state dict directly.
+    """
+    if isinstance(payload, dict) and 'meta' in payload:
+        return payload['data']
+    return payload
@@ -1,11 +1,24 @@
 import pygame
 import os
-import pickle
-import hashlib
 import time
+import concurrent.futures
+import functools
 from typing import Dict, Optional, List, Tuple, Any
 from enum import Enum
 
+from src.view.SaveCodec import UnsupportedSaveError, dump_save, load_save, unwrap_payload
+
+# Deletion table for characters that aren't filesystem-safe; built once
+# so sanitizing is a single str.translate call
+_FORBIDDEN_CHARS = str.maketrans('', '', '\\/*?:"<>|')
+
+
+@functools.lru_cache(maxsize=256)
+def _fmt_mtime(mod_time: int) -> str:
+    """Format a save file's mtime for display (cached - the load menu
+    asks for the same timestamps every frame)"""
+    return time.strftime("%Y-%m-%d %H:%M", time.localtime(mod_time))
+
 
 class PauseMenuState(Enum):
     MAIN = 0
@@ -23,6 +36,7 @@ class SaveGameMenu:
         """
         self.screen = screen
         self.game = game_instance
+        self._sw, self._sh = screen.get_size()
         self.selected_index = 0
         self.buttons: List[Tuple[pygame.Rect, str]] = []
         self.state = PauseMenuState.MAIN
@@ -31,6 +45,11 @@ class SaveGameMenu:
         self.input_text = ""
         self.input_active = False
 
+        # Cached input-text render so the blinking cursor doesn't force
+        # a font.render every frame
+        self._input_cache = (None, None)
+        self._cursor_surf = None
+
         # Colors
         self.bg_color = (0, 0, 0, 180)  # Semi-transparent background
         self.text_color = (200, 200, 200)
@@ -54,12 +73,20 @@ class SaveGameMenu:
         # Save files list
         self.save_files = []
         self.save_scroll_offset = 0
+        self._save_mtimes = {}
+
+        # Background writer so saving doesn't stall the frame
+        self._save_executor = concurrent.futures.ThreadPoolExecutor(max_workers=1)
 
 
     def draw_pause_overlay(self):
         """Draw the pause menu overlay"""
+        # Snapshot the screen size once per frame; each get_width/
+        # get_height is a separate C call
+        self._sw, self._sh = self.screen.get_size()
+
         # Create semi-transparent overlay
-        overlay = pygame.Surface((self.screen.get_width(), self.screen.get_height()))
+        overlay = pygame.Surface((self._sw, self._sh))
         overlay.set_alpha(128)  # 50% transparency
         overlay.fill((0, 0, 0))  # Black background
         self.screen.blit(overlay, (0, 0))
@@ -78,7 +105,7 @@ class SaveGameMenu:
         # Display status message if there is one
         if self.status_message and self.status_timer > 0:
             status_text = self.font.render(self.status_message, True, self.status_color)
-            status_rect = status_text.get_rect(center=(self.screen.get_width() // 2, self.screen.get_height() - 100))
+            status_rect = status_text.get_rect(center=(self._sw // 2, self._sh - 100))
             self.screen.blit(status_text, status_rect)
             self.status_timer -= 1
 
@@ -200,7 +227,7 @@ class SaveGameMenu:
 
             # Check for input box click in save menu
             if self.state == PauseMenuState.SAVE:
-                input_box = pygame.Rect(self.screen.get_width() // 2 - 200, 200, 400, 50)
+                input_box = pygame.Rect(self._sw // 2 - 200, 200, 400, 50)
                 if input_box.collidepoint(event.pos):
                     self.input_active = True
                 else:
@@ -212,7 +239,7 @@ class SaveGameMenu:
         """Render the pause menu options"""
         # Title
         title_text = self.font.render("GAME PAUSED", True, (255, 255, 255))
-        title_rect = title_text.get_rect(center=(self.screen.get_width() // 2, 100))
+        title_rect = title_text.get_rect(center=(self._sw // 2, 100))
         self.screen.blit(title_text, title_rect)
 
         # Define pause menu options
@@ -227,7 +254,7 @@ class SaveGameMenu:
         for i, option in enumerate(options):
             color = self.selected_color if i == self.selected_index else self.text_color
             text = self.font.render(option, True, color)
-            rect = text.get_rect(center=(self.screen.get_width() // 2, 150 + i * 60))
+            rect = text.get_rect(center=(self._sw // 2, 150 + i * 60))
             self.screen.blit(text, rect)
 
             # Add button rect for mouse interaction
@@ -249,14 +276,14 @@ class SaveGameMenu:
             pygame.draw.rect(self.screen, color, button_rect, 2)
 
         # Add quick save/load buttons
-        quick_save_btn = pygame.Rect(50, self.screen.get_height() - 120, 140, 40)
+        quick_save_btn = pygame.Rect(50, self._sh - 120, 140, 40)
         pygame.draw.rect(self.screen, self.button_color, quick_save_btn)
         quick_save_text = self.small_font.render("Quick Save (F5)", True, self.text_color)
         quick_save_rect = quick_save_text.get_rect(center=quick_save_btn.center)
         self.screen.blit(quick_save_text, quick_save_rect)
         self.buttons.append((quick_save_btn, "quick_save"))
 
-        quick_load_btn = pygame.Rect(50, self.screen.get_height() - 70, 140, 40)
+        quick_load_btn = pygame.Rect(50, self._sh - 70, 140, 40)
         pygame.draw.rect(self.screen, self.button_color, quick_load_btn)
         quick_load_text = self.small_font.render("Quick Load (F9)", True, self.text_color)
         quick_load_rect = quick_load_text.get_rect(center=quick_load_btn.center)
@@ -267,27 +294,34 @@ class SaveGameMenu:
         """Render the save game interface"""
         # Title
         title_text = self.font.render("SAVE GAME", True, (255, 255, 255))
-        title_rect = title_text.get_rect(center=(self.screen.get_width() // 2, 100))
+        title_rect = title_text.get_rect(center=(self._sw // 2, 100))
         self.screen.blit(title_text, title_rect)
 
         # Draw prompt
         prompt = self.font.render("Enter save name:", True, self.text_color)
-        prompt_rect = prompt.get_rect(center=(self.screen.get_width() // 2, 150))
+        prompt_rect = prompt.get_rect(center=(self._sw // 2, 150))
         self.screen.blit(prompt, prompt_rect)
 
         # Draw input box
-        input_box = pygame.Rect(self.screen.get_width() // 2 - 200, 200, 400, 50)
+        input_box = pygame.Rect(self._sw // 2 - 200, 200, 400, 50)
         pygame.draw.rect(self.screen, self.input_box_color, input_box)
         pygame.draw.rect(self.screen, self.text_color if not self.input_active else self.selected_color, input_box, 2)
 
-        # Draw input text
-        input_surf = self.font.render(self.input_text + ("|" if self.input_active and time.time() % 1 > 0.5 else ""),
-                                      True, self.text_color)
+        # Draw input text (re-rendered only when it changes)
+        if self._input_cache[0] != self.input_text:
+            self._input_cache = (self.input_text, self.font.render(self.input_text, True, self.text_color))
+        input_surf = self._input_cache[1]
         input_rect = input_surf.get_rect(midleft=(input_box.left + 10, input_box.centery))
         self.screen.blit(input_surf, input_rect)
 
+        # Blit the blinking cursor as a separate cached glyph
+        if self.input_active and time.time() % 1 > 0.5:
+            if self._cursor_surf is None:
+                self._cursor_surf = self.font.render("|", True, self.text_color)
+            self.screen.blit(self._cursor_surf, (input_rect.right, input_rect.top))
+
         # Draw save button
-        save_button = pygame.Rect(self.screen.get_width() // 2 - 100, 300, 200, 50)
+        save_button = pygame.Rect(self._sw // 2 - 100, 300, 200, 50)
         pygame.draw.rect(self.screen, self.button_color, save_button)
         save_text = self.font.render("Save", True, self.text_color)
         save_text_rect = save_text.get_rect(center=save_button.center)
@@ -295,7 +329,7 @@ class SaveGameMenu:
         self.buttons.append((save_button, "confirm_save"))
 
         # Draw back button
-        back_button = pygame.Rect(self.screen.get_width() // 2 - 100, 370, 200, 50)
+        back_button = pygame.Rect(self._sw // 2 - 100, 370, 200, 50)
         pygame.draw.rect(self.screen, self.button_color, back_button)
         back_text = self.font.render("Back", True, self.text_color)
         back_text_rect = back_text.get_rect(center=back_button.center)
@@ -306,13 +340,13 @@ class SaveGameMenu:
         """Render the load game interface"""
         # Title
         title_text = self.font.render("LOAD GAME", True, (255, 255, 255))
-        title_rect = title_text.get_rect(center=(self.screen.get_width() // 2, 100))
+        title_rect = title_text.get_rect(center=(self._sw // 2, 100))
         self.screen.blit(title_text, title_rect)
 
         # Draw save files list
         if not self.save_files:
             no_saves_text = self.font.render("No save files found", True, self.text_color)
-            no_saves_rect = no_saves_text.get_rect(center=(self.screen.get_width() // 2, 250))
+            no_saves_rect = no_saves_text.get_rect(center=(self._sw // 2, 250))
             self.screen.blit(no_saves_text, no_saves_rect)
         else:
             # Show list of save files
@@ -323,7 +357,7 @@ class SaveGameMenu:
                     continue
 
                 # Stop if we've displayed enough files
-                if list_y > self.screen.get_height() - 100:
+                if list_y > self._sh - 100:
                     break
 
                 # Get save name without extension
@@ -337,7 +371,7 @@ class SaveGameMenu:
                 # Draw save entry
                 color = self.selected_color if i == self.selected_index else self.text_color
                 text = self.font.render(save_name, True, color)
-                rect = text.get_rect(center=(self.screen.get_width() // 2, list_y))
+                rect = text.get_rect(center=(self._sw // 2, list_y))
                 self.screen.blit(text, rect)
 
                 # Add button
@@ -348,7 +382,7 @@ class SaveGameMenu:
                 list_y += 50
 
         # Draw back button
-        back_button = pygame.Rect(self.screen.get_width() // 2 - 100, self.screen.get_height() - 70, 200, 50)
+        back_button = pygame.Rect(self._sw // 2 - 100, self._sh - 70, 200, 50)
         pygame.draw.rect(self.screen, self.button_color, back_button)
         back_text = self.font.render("Back", True, self.text_color)
         back_text_rect = back_text.get_rect(center=back_button.center)
@@ -358,21 +392,32 @@ class SaveGameMenu:
     def refresh_save_files(self):
         """Refresh the list of save files"""
         try:
-            # Get all .save files
-            self.save_files = [f for f in os.listdir(self.__save_dir) if f.endswith('.save')]
+            # scandir gives name and mtime in one pass instead of a
+            # separate stat (plus path join) per file
+            with os.scandir(self.__save_dir) as it:
+                entries = [(e.name, e.stat().st_mtime)
+                           for e in it if e.is_file() and e.name.endswith('.save')]
             # Sort by modification time (newest first)
-            self.save_files.sort(key=lambda x: os.path.getmtime(os.path.join(self.__save_dir, x)), reverse=True)
+            entries.sort(key=lambda t: t[1], reverse=True)
+            self.save_files = [name for name, _ in entries]
+            self._save_mtimes = dict(entries)
         except Exception as e:
             print(f"Error refreshing save files: {e}")
             self.save_files = []
+            self._save_mtimes = {}
 
     def _get_save_timestamp(self, save_name):
         """Get a formatted timestamp for a save file"""
         try:
-            save_path = os.path.join(self.__save_dir, f"{save_name}.save")
-            if os.path.exists(save_path):
+            # Prefer the mtime captured by refresh_save_files to avoid
+            # re-statting the file every frame
+            mod_time = self._save_mtimes.get(f"{save_name}.save")
+            if mod_time is None:
+                save_path = os.path.join(self.__save_dir, f"{save_name}.save")
+                if not os.path.exists(save_path):
+                    return None
                 mod_time = os.path.getmtime(save_path)
-                return time.strftime("%Y-%m-%d %H:%M", time.localtime(mod_time))
+            return _fmt_mtime(int(mod_time))
         except Exception:
             pass
         return None
@@ -399,9 +444,7 @@ class SaveGameMenu:
             Sanitized filename
         """
         # Remove invalid characters
-        import re
-        filename = re.sub(r'[\\/*?:"<>|]', "", filename)
-        filename = filename.strip()
+        filename = filename.translate(_FORBIDDEN_CHARS).strip()
 
         # Use default if empty
         if not filename:
@@ -436,28 +479,53 @@ class SaveGameMenu:
             if not safe_name:
                 return False
 
-            # Add metadata
-            game_state['__meta'] = {
-                'timestamp': time.time(),
-                'version': '1.0'
+            # Wrap state and metadata together rather than mutating the
+            # caller's dict with a '__meta' entry
+            payload = {
+                'data': game_state,
+                'meta': {
+                    'timestamp': time.time(),
+                    'version': '1.0'
+                }
             }
 
-            # Generate checksum for integrity verification
-            state_bytes = pickle.dumps(game_state)
-            checksum = hashlib.sha256(state_bytes).hexdigest()
-
-            # Save file with checksum
-            with open(os.path.join(self.__save_dir, f"{safe_name}.save"), 'wb') as f:
-                pickle.dump({'checksum': checksum, 'data': game_state}, f)
+            # Hand the whole pickle/hash/compress/write pipeline to the
+            # background thread; only the cheap state capture stays on
+            # the frame. The payload must hold plain picklable data
+            # (get_serializable_state returns primitives only).
+            save_path = os.path.join(self.__save_dir, f"{safe_name}.save")
+            future = self._save_executor.submit(self._finish_save, save_path, payload)
+            future.add_done_callback(self._on_save_done)
 
-            # Show success status
-            self.show_status("Game saved successfully!", (0, 255, 0))
+            self.show_status("Saving...", (255, 255, 255))
             return True
         except Exception as e:
             print(f"Error saving game: {e}")
             self.show_status("Failed to save game!", (255, 0, 0))
             return False
 
+    def _finish_save(self, save_path, payload):
+        """Serialize and persist a save payload (runs on the background thread)
+
+        Args:
+            save_path: Destination path for the save file
+            payload: State/meta dict captured on the main thread
+        """
+        # Encode to a temp file then swap it in atomically
+        tmp_path = save_path + '.tmp'
+        with open(tmp_path, 'wb') as f:
+            dump_save(f, payload)
+        os.replace(tmp_path, save_path)
+
+    def _on_save_done(self, future):
+        """Report the background save's outcome via the status message"""
+        try:
+            future.result()
+            self.show_status("Game saved successfully!", (0, 255, 0))
+        except Exception as e:
+            print(f"Error saving game: {e}")
+            self.show_status("Failed to save game!", (255, 0, 0))
+
     def load_game(self, save_name: str) -> bool:
         """
         Load game state from file
@@ -479,18 +547,20 @@ class SaveGameMenu:
                 self.show_status(f"Save file not found!", (255, 0, 0))
                 return False
 
-            # Load save file
-            with open(save_path, 'rb') as f:
-                save_data = pickle.load(f)
-
-            # Verify checksum
-            checksum = save_data['checksum']
-            game_state = save_data['data']
+            # Decode through the shared codec, which handles every
+            # format this game has ever written
+            try:
+                with open(save_path, 'rb') as f:
+                    payload, valid = load_save(f)
+            except UnsupportedSaveError:
+                self.show_status("Save requires zstd support!", (255, 0, 0))
+                return False
 
-            calculated_checksum = hashlib.sha256(pickle.dumps(game_state)).hexdigest()
-            if checksum != calculated_checksum:
+            if not valid:
                 self.show_status("Warning: Save file may be corrupted", (255, 255, 0))
 
+            game_state = unwrap_payload(payload)
+
             # Load state into game
             if self.game.load_from_state(game_state):
                 self.show_status("Game loaded successfully!", (0, 255, 0))
@@ -1,5 +1,5 @@
 import pygame
-import csv
+import numpy as np
 
 class TileRenderer:
     def __init__(self, csv_path, tileset_path, tile_width, tile_height):
@@ -11,28 +11,53 @@ class TileRenderer:
         self._tilemap = []
         self._load_tileset()
         self._load_csv()
+        self._bake_background()
 
     def _load_tileset(self):
         tileset_img = pygame.image.load(self._tileset_path).convert_alpha()
         tileset_width, tileset_height = tileset_img.get_size()
+        tw, th = self._tile_width, self._tile_height
+        cols = tileset_width // tw
+        rows = tileset_height // th
 
-        for y in range(0, tileset_height, self._tile_height):
-            for x in range(0, tileset_width, self._tile_width):
-                rect = pygame.Rect(x, y, self._tile_width, self._tile_height)
-                tile = tileset_img.subsurface(rect)
-                self._tiles.append(tile)
+        # Copy breaks the subsurface link so SDL treats each tile as a
+        # standalone surface; convert_alpha optimizes its format for
+        # fast per-blit alpha blending
+        self._tiles = [
+            tileset_img.subsurface((c * tw, r * th, tw, th)).copy().convert_alpha()
+            for r in range(rows) for c in range(cols)
+        ]
 
     def _load_csv(self):
-        with open(self._csv_path, newline='') as csvfile:
-            reader = csv.reader(csvfile)
-            self._tilemap = [[int(tile) for tile in row] for row in reader]
+        # loadtxt parses the whole grid in C, far faster than a
+        # per-cell int() loop on large maps
+        self._tilemap = np.loadtxt(self._csv_path, delimiter=',', dtype=np.int32, ndmin=2)
+        self._build_blit_plan()
+
+    def _build_blit_plan(self):
+        # The tilemap is static, so resolve tile surfaces and world
+        # coordinates once instead of every frame
+        rows, cols = np.where((self._tilemap >= 0) & (self._tilemap < len(self._tiles)))
+        indices = self._tilemap[rows, cols]
+        self._blit_plan = [
+            (self._tiles[idx], int(col) * self._tile_width, int(row) * self._tile_height)
+            for idx, col, row in zip(indices, cols, rows)
+        ]
+
+    def _bake_background(self):
+        # Render the whole static tilemap to one surface up front so
+        # each frame is a single blit instead of one per tile
+        rows, cols = self._tilemap.shape
+        self._baked = None
+        if rows and cols:
+            width = cols * self._tile_width
+            height = rows * self._tile_height
+            self._baked = pygame.Surface((width, height), pygame.SRCALPHA)
+            # fblits (pygame-ce) is the fastest batch path; fall back to
+            # blits on mainline pygame
+            batch_blit = getattr(self._baked, 'fblits', self._baked.blits)
+            batch_blit([(tile, (x, y)) for tile, x, y in self._blit_plan])
 
     def draw(self, surface, camera_offset=(0, 0)):
-        for row_idx, row in enumerate(self._tilemap):
-            for col_idx, tile_idx in enumerate(row):
-                if tile_idx >= 0 and tile_idx < len(self._tiles):
-                    tile = self._tiles[tile_idx]
-                    surface.blit(tile, (
-                        col_idx * self._tile_width - camera_offset[0],
-                        row_idx * self._tile_height - camera_offset[1]
-                    ))
+        if self._baked is not None:
+            surface.blit(self._baked, (-camera_offset[0], -camera_offset[1]))
@@ -0,0 +1,110 @@
+"""Shared fixtures for the model test suite.
+
+Hero and character construction is the dominant fixture cost in these
+files, so the read-only variants are built once per session and the
+mutating variants stay function-scoped. The DemonBoss fixtures live in
+test_demon_boss.py because they need that module's pygame patching
+active while they build.
+"""
+import pytest
+from unittest.mock import patch
+from src.model.archer import Archer
+from src.model.cleric import Cleric
+from src.model.DungeonCharacter import DungeonCharacter
+
+HERO_X, HERO_Y = 100, 200
+
+CHAR_X, CHAR_Y = 100, 200
+CHAR_WIDTH, CHAR_HEIGHT = 64, 64
+CHAR_NAME = "TestCharacter"
+CHAR_MAX_HEALTH = 100
+CHAR_HEALTH = 100
+CHAR_SPEED = 5
+CHAR_DAMAGE = 10
+
+
+def assert_repr_contains(obj, parts):
+    """Assert str(obj) contains every expected part, stringifying once"""
+    text = str(obj)
+    for part in parts:
+        assert part in text, f"{part!r} not in {text!r}"
+
+
+class DamageRecorder:
+    """Minimal attack-target stub; records take_damage calls without
+    MagicMock's dynamic attribute machinery"""
+
+    __slots__ = ("calls",)
+
+    def __init__(self):
+        self.calls = []
+
+    def take_damage(self, amount):
+        self.calls.append(amount)
+
+
+@pytest.fixture
+def target():
+    """Fresh attack target for combat tests"""
+    return DamageRecorder()
+
+
+def _make_character():
+    return DungeonCharacter(
+        CHAR_X, CHAR_Y, CHAR_WIDTH, CHAR_HEIGHT, CHAR_NAME,
+        CHAR_MAX_HEALTH, CHAR_HEALTH, CHAR_SPEED, CHAR_DAMAGE
+    )
+
+
+@pytest.fixture(scope="session")
+def shared_archer():
+    """Single Archer shared by tests that never mutate it"""
+    return Archer(HERO_X, HERO_Y)
+
+
+@pytest.fixture
+def archer():
+    """Fresh Archer for tests that mutate state"""
+    return Archer(HERO_X, HERO_Y)
+
+
+@pytest.fixture(scope="session")
+def shared_cleric():
+    """Single Cleric shared by tests that never mutate it"""
+    return Cleric(HERO_X, HERO_Y)
+
+
+@pytest.fixture
+def cleric():
+    """Fresh Cleric for tests that mutate state"""
+    return Cleric(HERO_X, HERO_Y)
+
+
+@pytest.fixture(scope="session")
+def shared_character():
+    """Single DungeonCharacter shared by tests that never mutate it"""
+    return _make_character()
+
+
+@pytest.fixture
+def character():
+    """Fresh DungeonCharacter for tests that mutate state"""
+    return _make_character()
+
+
+@pytest.fixture(scope="module")
+def _parent_special_patcher():
+    """Start the parent-method patcher once per consuming module; a
+    wider scope would leave Hero.activate_special_ability mocked for
+    unrelated tests collected later in the run"""
+    patcher = patch('src.model.DungeonHero.Hero.activate_special_ability')
+    mock_parent = patcher.start()
+    yield mock_parent
+    patcher.stop()
+
+
+@pytest.fixture
+def mock_parent_special(_parent_special_patcher):
+    """Per-test view of the shared patcher with call history cleared"""
+    _parent_special_patcher.reset_mock()
+    return _parent_special_patcher
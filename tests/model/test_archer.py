@@ -1,137 +1,143 @@
-import unittest
-from unittest.mock import MagicMock, patch
+import copy
+import pytest
+from unittest.mock import MagicMock
 from src.model.archer import Archer
 from src.model.DungeonEntity import Direction
+from conftest import HERO_X, HERO_Y
 
+# Prototype target mock built once; tests deep-copy it instead of
+# paying MagicMock construction + configuration per test
+_TARGET_PROTO = MagicMock(**{
+    "is_alive": True,
+    "hitbox.colliderect.return_value": True,
+    "take_damage.return_value": True,
+})
 
-class TestArcher(unittest.TestCase):
-    """Tests for the Archer hero class"""
-
-    def setUp(self):
-        """Set up an Archer instance for testing"""
-        self.x, self.y = 100, 200
-        self.archer = Archer(self.x, self.y)
-
-    def test_initialization(self):
-        """Test that an Archer is initialized with correct values"""
-        self.assertEqual(self.archer.get_x(), self.x)
-        self.assertEqual(self.archer.get_y(), self.y)
-        self.assertEqual(self.archer.get_hero_type(), "archer")
-        self.assertTrue(self.archer.get_is_alive())
-        
-        # Archer specific attributes
-        self.assertGreater(self.archer.get_attack_range(), 0)  # Should have positive attack range
-        if hasattr(self.archer, "get_arrow_damage"):
-            self.assertGreater(self.archer.get_arrow_damage(), 0)
-        if hasattr(self.archer, "get_arrow_speed"):
-            self.assertGreater(self.archer.get_arrow_speed(), 0)
-
-    def test_calculate_damage(self):
-        """Test archer damage calculation"""
-        # Create a mock target
-        target = MagicMock()
-        
-        # Test normal damage
-        base_damage = self.archer.get_damage()
-        damage = self.archer.calculate_damage(target)
-        self.assertEqual(damage, base_damage)  # Default damage without any modifiers
-        
-        # Test different distances if archer has distance bonus
-        if hasattr(self.archer, "get_distance_damage_bonus"):
-            # Set archer position
-            self.archer.set_x(100)
-            self.archer.set_y(100)
-            
-            # Test with a distant target
-            target.get_x.return_value = 300
-            target.get_y.return_value = 100
-            far_damage = self.archer.calculate_damage(target)
-            
-            # Test with a close target
-            target.get_x.return_value = 120
-            target.get_y.return_value = 100
-            close_damage = self.archer.calculate_damage(target)
-            
-            # Damage should be higher at optimal range
-            self.assertGreaterEqual(far_damage, close_damage)
-
-    def test_special_ability(self):
-        """Test archer's special ability activation"""
-        # Create a mock for the parent class method
-        with patch('src.model.DungeonHero.Hero.activate_special_ability') as mock_parent:
-            # Create a mock projectile manager if needed
-            if hasattr(self.archer, "get_projectile_manager") or hasattr(self.archer, "projectile_manager"):
-                projectile_manager = MagicMock()
-                if hasattr(self.archer, "set_projectile_manager"):
-                    self.archer.set_projectile_manager(projectile_manager)
-                else:
-                    self.archer.projectile_manager = projectile_manager
-                
-                # Activate special ability
-                self.archer.activate_special_ability()
-                
-                # Verify parent method was called
-                mock_parent.assert_called_once()
-                
-                # Verify projectile was created
-                projectile_manager.add_projectile.assert_called()
-            else:
-                # Just test that the method runs without error
-                self.archer.activate_special_ability()
-                mock_parent.assert_called_once()
-
-    def test_attack(self):
-        """Test archer's attack method if it has one"""
-        if hasattr(self.archer, "attack") and callable(getattr(self.archer, "attack")):
-            # Set up targets
-            target1 = MagicMock()
-            target1.is_alive = True
-            target1.hitbox = MagicMock()
-            target1.hitbox.colliderect.return_value = True
-            target1.take_damage.return_value = True
-            
-            target2 = MagicMock()
-            target2.is_alive = True
-            target2.hitbox = MagicMock()
-            target2.hitbox.colliderect.return_value = False
-            
-            targets = [target1, target2]
-            
-            # Set archer to attacking state
-            if hasattr(self.archer, "set_is_attacking"):
-                self.archer.set_is_attacking(True)
-            elif hasattr(self.archer, "is_attacking"):
-                self.archer.is_attacking = True
-            
-            # Mock get_attack_hitbox if needed
-            if hasattr(self.archer, "get_attack_hitbox"):
-                original_get_attack_hitbox = self.archer.get_attack_hitbox
-                self.archer.get_attack_hitbox = MagicMock(return_value=MagicMock())
-            
-            # Call attack method
-            hit_targets = self.archer.attack(targets)
-            
-            # Verify results
-            self.assertEqual(len(hit_targets), 1)
-            self.assertIn(target1, hit_targets)
-            self.assertNotIn(target2, hit_targets)
-            target1.take_damage.assert_called_once()
-            
-            # Restore original method if mocked
-            if hasattr(self.archer, "get_attack_hitbox") and self.archer.get_attack_hitbox != original_get_attack_hitbox:
-                self.archer.get_attack_hitbox = original_get_attack_hitbox
-
-    def test_string_representation(self):
-        """Test the string representation of the archer"""
-        archer_str = str(self.archer)
-        
-        # Check that string contains important information
-        self.assertIn("archer", archer_str.lower())
-        
-        # Check if health is included
-        health_str = f"{self.archer.get_health()}/{self.archer.get_max_health()}"
-        self.assertIn(health_str, archer_str)
-
-
-if __name__ == '__main__':
-    unittest.main()
\ No newline at end of file
+# Capability probes computed once at import instead of re-running
+# hasattr against the instance in every test
+_PROTO_ARCHER = Archer(0, 0)
+_ARCHER_CAPS = {
+    name: hasattr(_PROTO_ARCHER, name)
+    for name in (
+        "attack", "get_attack_hitbox", "set_is_attacking", "is_attacking",
+        "get_projectile_manager", "projectile_manager", "set_projectile_manager",
+        "get_distance_damage_bonus", "get_arrow_damage", "get_arrow_speed",
+    )
+}
+
+# Expected substrings for the string representation, computed once
+# against the prototype instead of re-calling getters per test
+_EXPECTED_HEALTH_STR = f"{_PROTO_ARCHER.get_health()}/{_PROTO_ARCHER.get_max_health()}"
+
+# Archer fixtures (shared_archer/archer/mock_parent_special) live in
+# conftest.py so all four model test files share them
+
+
+def test_initialization(shared_archer):
+    """Test that an Archer is initialized with correct values"""
+    assert shared_archer.get_x() == HERO_X
+    assert shared_archer.get_y() == HERO_Y
+    assert shared_archer.get_hero_type() == "archer"
+    assert shared_archer.get_is_alive()
+
+    # Archer specific attributes
+    assert shared_archer.get_attack_range() > 0  # Should have positive attack range
+    if _ARCHER_CAPS["get_arrow_damage"]:
+        assert shared_archer.get_arrow_damage() > 0
+    if _ARCHER_CAPS["get_arrow_speed"]:
+        assert shared_archer.get_arrow_speed() > 0
+
+
+def test_string_representation(shared_archer):
+    """Test the string representation of the archer"""
+    archer_str = str(shared_archer)
+
+    # Check that string contains important information
+    assert "archer" in archer_str.lower()
+
+    # Check if health is included
+    assert _EXPECTED_HEALTH_STR in archer_str
+
+
+def test_calculate_damage(archer):
+    """Test archer damage calculation"""
+    # Create a mock target
+    target = MagicMock()
+
+    # Test normal damage
+    base_damage = archer.get_damage()
+    damage = archer.calculate_damage(target)
+    assert damage == base_damage  # Default damage without any modifiers
+
+    # Test different distances if archer has distance bonus
+    if _ARCHER_CAPS["get_distance_damage_bonus"]:
+        # Set archer position
+        archer.set_x(100)
+        archer.set_y(100)
+
+        # Test with a distant target
+        target.get_x.return_value = 300
+        target.get_y.return_value = 100
+        far_damage = archer.calculate_damage(target)
+
+        # Test with a close target
+        target.get_x.return_value = 120
+        target.get_y.return_value = 100
+        close_damage = archer.calculate_damage(target)
+
+        # Damage should be higher at optimal range
+        assert far_damage >= close_damage
+
+
+def test_special_ability(archer, mock_parent_special):
+    """Test archer's special ability activation"""
+    # Create a mock projectile manager if needed
+    if _ARCHER_CAPS["get_projectile_manager"] or _ARCHER_CAPS["projectile_manager"]:
+        projectile_manager = MagicMock()
+        if _ARCHER_CAPS["set_projectile_manager"]:
+            archer.set_projectile_manager(projectile_manager)
+        else:
+            archer.projectile_manager = projectile_manager
+
+        # Activate special ability
+        archer.activate_special_ability()
+
+        # Verify parent method was called
+        mock_parent_special.assert_called_once()
+
+        # Verify projectile was created
+        projectile_manager.add_projectile.assert_called()
+    else:
+        # Just test that the method runs without error
+        archer.activate_special_ability()
+        mock_parent_special.assert_called_once()
+
+
+@pytest.mark.skipif(not _ARCHER_CAPS["attack"], reason="Archer has no attack method")
+@pytest.mark.parametrize("hit,expected_hits", [(True, 1), (False, 0)])
+def test_attack(archer, hit, expected_hits):
+    """Test archer's attack method filters targets by hitbox overlap"""
+    # One target per case instead of a hit/miss pair per run
+    target = copy.deepcopy(_TARGET_PROTO)
+    target.hitbox.colliderect.return_value = hit
+
+    # Set archer to attacking state
+    if _ARCHER_CAPS["set_is_attacking"]:
+        archer.set_is_attacking(True)
+    elif _ARCHER_CAPS["is_attacking"]:
+        archer.is_attacking = True
+
+    # Mock get_attack_hitbox if needed
+    if _ARCHER_CAPS["get_attack_hitbox"]:
+        archer.get_attack_hitbox = MagicMock(return_value=MagicMock())
+
+    # Call attack method
+    hit_targets = archer.attack([target])
+
+    # Verify results
+    assert len(hit_targets) == expected_hits
+    if hit:
+        assert target in hit_targets
+        target.take_damage.assert_called_once()
+    else:
+        target.take_damage.assert_not_called()
@@ -1,5 +1,6 @@
-import unittest
-from unittest.mock import MagicMock, patch
+import copy
+import pytest
+from unittest.mock import MagicMock
 import pygame
 from src.model.DemonBoss import DemonBoss
 from src.model.DungeonEntity import Direction, AnimationState
@@ -11,7 +12,7 @@ class MockRect:
         self.y = y
         self.width = width
         self.height = height
-        
+
     def colliderect(self, other):
         # Simple collision check
         return (self.x < other.x + other.width and
@@ -23,192 +24,214 @@ class MockRect:
 class MockSurface:
     def __init__(self, size):
         self.size = size
-        
+
     def fill(self, color):
         pass
 
 
-class TestDemonBoss(unittest.TestCase):
-    """Tests for the DemonBoss class"""
-
-    def setUp(self):
-        """Set up a DemonBoss instance for testing"""
-        # Mock pygame dependencies
-        pygame.Surface = MagicMock(return_value=MockSurface((128, 128)))
-        pygame.Rect = MagicMock(side_effect=MockRect)
-        
-        self.x, self.y = 300, 400
-        self.boss = DemonBoss(self.x, self.y)
-
-    def test_initialization(self):
-        """Test that a DemonBoss is initialized with correct values"""
-        self.assertEqual(self.boss.get_x(), self.x)
-        self.assertEqual(self.boss.get_y(), self.y)
-        self.assertEqual(self.boss.get_name(), "Demon Boss")
-        self.assertEqual(self.boss.get_enemy_type(), "demon_boss")
-        self.assertEqual(self.boss.get_max_health(), 500)
-        self.assertEqual(self.boss.get_health(), 500)
-        self.assertEqual(self.boss.get_damage(), 25)
-        self.assertEqual(self.boss.get_attack_range(), 120)
-        self.assertTrue(self.boss.is_alive)
-        self.assertFalse(self.boss.is_enraged())
-
-    def test_take_damage(self):
-        """Test boss taking damage"""
-        initial_health = self.boss.get_health()
-        damage = 50
-        
-        # Boss takes damage
-        result = self.boss.take_damage(damage)
-        
-        # Check result and health
-        self.assertTrue(result)
-        self.assertEqual(self.boss.get_health(), initial_health - damage)
-        self.assertEqual(self.boss.get_animation_state(), AnimationState.HURT)
-        self.assertTrue(self.boss.is_invulnerable())
-
-    def test_fatal_damage(self):
-        """Test boss taking fatal damage"""
-        # Set boss to low health
-        self.boss.health = 20
-        
-        # Take fatal damage
-        result = self.boss.take_damage(50)
-        
-        # Check result and state
-        self.assertTrue(result)
-        self.assertEqual(self.boss.get_health(), 0)
-        self.assertFalse(self.boss.is_alive)
-        self.assertEqual(self.boss.get_animation_state(), AnimationState.DYING)
-
-    def test_damage_while_invulnerable(self):
-        """Test that boss doesn't take damage while invulnerable"""
-        # Make boss invulnerable
-        self.boss._DemonBoss__is_invulnerable = True
-        initial_health = self.boss.get_health()
-        
-        # Try to damage boss
-        result = self.boss.take_damage(50)
-        
-        # Check result and health
-        self.assertFalse(result)
-        self.assertEqual(self.boss.get_health(), initial_health)
-
-    def test_enrage_threshold(self):
-        """Test that boss enrages at low health"""
-        # Boss starts not enraged
-        self.assertFalse(self.boss.is_enraged())
-        
-        # Set health just above threshold
-        threshold = self.boss.get_enrage_threshold()
-        self.boss.health = int(self.boss.get_max_health() * threshold) + 1
-        
-        # Update boss to check enrage state
-        self.boss.update(0.1)
-        self.assertFalse(self.boss.is_enraged())
-        
-        # Drop health below threshold
-        self.boss.health = int(self.boss.get_max_health() * threshold) - 1
-        
-        # Update boss to check enrage state
-        self.boss.update(0.1)
-        self.assertTrue(self.boss.is_enraged())
-        
-        # Check that damage and speed were increased
-        self.assertGreater(self.boss.get_damage(), 25)  # Original damage
-        self.assertGreater(self.boss.get_speed(), 3)   # Original speed
-
-    def test_attack_cooldown(self):
-        """Test attack cooldown mechanics"""
-        # Create a mock target
-        target = MagicMock()
-        target.hitbox = MockRect(self.x + 50, self.y, 50, 50)  # Within attack range
-        
-        # Initial attack should succeed
-        initial_attack = self.boss.attack(target)
-        self.assertTrue(initial_attack)
-        self.assertTrue(self.boss.is_attacking())
-        self.assertGreater(self.boss.get_attack_cooldown(), 0)
-        
-        # Second attack should fail due to cooldown
-        second_attack = self.boss.attack(target)
-        self.assertFalse(second_attack)
-        
-        # Reduce cooldown
-        self.boss._update_attack_cooldown(1.0)
-        
-        # Attack should still fail as cooldown may not be fully reset
-        third_attack = self.boss.attack(target)
-        self.assertFalse(third_attack)
-        
-        # Fully reset cooldown
-        self.boss._DemonBoss__attack_cooldown = 0
-        self.boss._DemonBoss__is_attacking = False
-        
-        # Attack should succeed now
-        fourth_attack = self.boss.attack(target)
-        self.assertTrue(fourth_attack)
-
-    def test_move_towards_target(self):
-        """Test boss movement towards target"""
-        initial_x = self.boss.get_x()
-        initial_y = self.boss.get_y()
-        
-        # Target is far to the right
-        target_x = initial_x + 500
-        target_y = initial_y
-        
-        # Move towards target
-        self.boss.move_towards_target(target_x, target_y, 0.1)
-        
-        # Boss should have moved right
-        self.assertGreater(self.boss.get_x(), initial_x)
-        self.assertEqual(self.boss.get_direction(), Direction.RIGHT)
-        self.assertEqual(self.boss.get_animation_state(), AnimationState.WALKING)
-        
-        # Reset position
-        self.boss.x = initial_x
-        self.boss.y = initial_y
-        
-        # Target is within attack range
-        target_x = initial_x + 50  # Within attack_range (120)
-        target_y = initial_y
-        
-        # Move towards target
-        self.boss.move_towards_target(target_x, target_y, 0.1)
-        
-        # Boss should not have moved (in attack range)
-        self.assertEqual(self.boss.get_x(), initial_x)
-        self.assertEqual(self.boss.get_animation_state(), AnimationState.IDLE)
-        
-        # Test not moving when attacking
-        self.boss._DemonBoss__is_attacking = True
-        
-        # Target is far
-        target_x = initial_x + 500
-        target_y = initial_y
-        
-        # Try to move
-        self.boss.move_towards_target(target_x, target_y, 0.1)
-        
-        # Boss should not have moved (is attacking)
-        self.assertEqual(self.boss.get_x(), initial_x)
-
-    def test_string_representation(self):
-        """Test the string representation of the boss"""
-        boss_str = str(self.boss)
-        
-        # Check that string contains important information
-        self.assertIn("Demon Boss", boss_str)
-        self.assertIn("HP: 500/500", boss_str)
-        self.assertIn("DMG: 25", boss_str)
-        self.assertIn("Normal", boss_str)  # Not enraged
-        
-        # Enrage boss and check updated string
-        self.boss._DemonBoss__enraged = True
-        boss_str = str(self.boss)
-        self.assertIn("ENRAGED", boss_str)
-
-
-if __name__ == '__main__':
-    unittest.main()
\ No newline at end of file
+# Prototype target mock built once; tests deep-copy it instead of
+# paying MagicMock construction per test
+_TARGET_PROTO = MagicMock()
+
+BOSS_X, BOSS_Y = 300, 400
+
+
+@pytest.fixture(scope="module", autouse=True)
+def mock_pygame():
+    """Mock pygame dependencies once for the whole module"""
+    original_surface = pygame.Surface
+    original_rect = pygame.Rect
+    pygame.Surface = MagicMock(return_value=MockSurface((128, 128)))
+    pygame.Rect = MagicMock(side_effect=MockRect)
+    yield
+    pygame.Surface = original_surface
+    pygame.Rect = original_rect
+
+
+@pytest.fixture(scope="module")
+def shared_boss(mock_pygame):
+    """Single DemonBoss shared by tests that never mutate it"""
+    return DemonBoss(BOSS_X, BOSS_Y)
+
+
+@pytest.fixture
+def boss(mock_pygame):
+    """Fresh DemonBoss for tests that mutate state"""
+    return DemonBoss(BOSS_X, BOSS_Y)
+
+
+def test_initialization(shared_boss):
+    """Test that a DemonBoss is initialized with correct values"""
+    assert shared_boss.get_x() == BOSS_X
+    assert shared_boss.get_y() == BOSS_Y
+    assert shared_boss.get_name() == "Demon Boss"
+    assert shared_boss.get_enemy_type() == "demon_boss"
+    assert shared_boss.get_max_health() == 500
+    assert shared_boss.get_health() == 500
+    assert shared_boss.get_damage() == 25
+    assert shared_boss.get_attack_range() == 120
+    assert shared_boss.is_alive
+    assert not shared_boss.is_enraged()
+
+
+def test_take_damage(boss):
+    """Test boss taking damage"""
+    initial_health = boss.get_health()
+    damage = 50
+
+    # Boss takes damage
+    result = boss.take_damage(damage)
+
+    # Check result and health
+    assert result
+    assert boss.get_health() == initial_health - damage
+    assert boss.get_animation_state() == AnimationState.HURT
+    assert boss.is_invulnerable()
+
+
+def test_fatal_damage(boss):
+    """Test boss taking fatal damage"""
+    # Set boss to low health
+    boss.health = 20
+
+    # Take fatal damage
+    result = boss.take_damage(50)
+
+    # Check result and state
+    assert result
+    assert boss.get_health() == 0
+    assert not boss.is_alive
+    assert boss.get_animation_state() == AnimationState.DYING
+
+
+def test_damage_while_invulnerable(boss):
+    """Test that boss doesn't take damage while invulnerable"""
+    # Make boss invulnerable
+    boss._DemonBoss__is_invulnerable = True
+    initial_health = boss.get_health()
+
+    # Try to damage boss
+    result = boss.take_damage(50)
+
+    # Check result and health
+    assert not result
+    assert boss.get_health() == initial_health
+
+
+def test_enrage_threshold(boss):
+    """Test that boss enrages at low health"""
+    # Boss starts not enraged
+    assert not boss.is_enraged()
+
+    # Set health just above threshold
+    threshold = boss.get_enrage_threshold()
+    boss.health = int(boss.get_max_health() * threshold) + 1
+
+    # Update boss to check enrage state
+    boss.update(0.1)
+    assert not boss.is_enraged()
+
+    # Drop health below threshold
+    boss.health = int(boss.get_max_health() * threshold) - 1
+
+    # Update boss to check enrage state
+    boss.update(0.1)
+    assert boss.is_enraged()
+
+    # Check that damage and speed were increased
+    assert boss.get_damage() > 25  # Original damage
+    assert boss.get_speed() > 3   # Original speed
+
+
+def test_attack_cooldown(boss):
+    """Test attack cooldown mechanics"""
+    # Create a mock target from the shared prototype
+    target = copy.deepcopy(_TARGET_PROTO)
+    target.hitbox = MockRect(BOSS_X + 50, BOSS_Y, 50, 50)  # Within attack range
+
+    # Initial attack should succeed
+    initial_attack = boss.attack(target)
+    assert initial_attack
+    assert boss.is_attacking()
+    assert boss.get_attack_cooldown() > 0
+
+    # Second attack should fail due to cooldown
+    second_attack = boss.attack(target)
+    assert not second_attack
+
+    # Reduce cooldown
+    boss._update_attack_cooldown(1.0)
+
+    # Attack should still fail as cooldown may not be fully reset
+    third_attack = boss.attack(target)
+    assert not third_attack
+
+    # Fully reset cooldown
+    boss._DemonBoss__attack_cooldown = 0
+    boss._DemonBoss__is_attacking = False
+
+    # Attack should succeed now
+    fourth_attack = boss.attack(target)
+    assert fourth_attack
+
+
+def test_move_towards_target(boss):
+    """Test boss movement towards target"""
+    initial_x = boss.get_x()
+    initial_y = boss.get_y()
+
+    # Target is far to the right
+    target_x = initial_x + 500
+    target_y = initial_y
+
+    # Move towards target
+    boss.move_towards_target(target_x, target_y, 0.1)
+
+    # Boss should have moved right
+    assert boss.get_x() > initial_x
+    assert boss.get_direction() == Direction.RIGHT
+    assert boss.get_animation_state() == AnimationState.WALKING
+
+    # Reset position
+    boss.x = initial_x
+    boss.y = initial_y
+
+    # Target is within attack range
+    target_x = initial_x + 50  # Within attack_range (120)
+    target_y = initial_y
+
+    # Move towards target
+    boss.move_towards_target(target_x, target_y, 0.1)
+
+    # Boss should not have moved (in attack range)
+    assert boss.get_x() == initial_x
+    assert boss.get_animation_state() == AnimationState.IDLE
+
+    # Test not moving when attacking
+    boss._DemonBoss__is_attacking = True
+
+    # Target is far
+    target_x = initial_x + 500
+    target_y = initial_y
+
+    # Try to move
+    boss.move_towards_target(target_x, target_y, 0.1)
+
+    # Boss should not have moved (is attacking)
+    assert boss.get_x() == initial_x
+
+
+def test_string_representation(boss):
+    """Test the string representation of the boss"""
+    boss_str = str(boss)
+
+    # Check that string contains important information
+    assert "Demon Boss" in boss_str
+    assert "HP: 500/500" in boss_str
+    assert "DMG: 25" in boss_str
+    assert "Normal" in boss_str  # Not enraged
+
+    # Enrage boss and check updated string
+    boss._DemonBoss__enraged = True
+    boss_str = str(boss)
+    assert "ENRAGED" in boss_str
@@ -1,166 +1,167 @@
-import unittest
-from unittest.mock import MagicMock, patch
+import re
+import pytest
+from unittest.mock import MagicMock
 from src.model.DungeonCharacter import DungeonCharacter
+from conftest import (
+    CHAR_X, CHAR_Y, CHAR_WIDTH, CHAR_HEIGHT, CHAR_NAME,
+    CHAR_MAX_HEALTH, CHAR_HEALTH, CHAR_SPEED, CHAR_DAMAGE,
+)
 
+# Capability probes computed once at import instead of re-running
+# hasattr against the instance in every test
+_CHARACTER_CAPS = {
+    name: hasattr(DungeonCharacter, name)
+    for name in ("attack", "jump")
+}
 
-class TestDungeonCharacter(unittest.TestCase):
-    """Tests for the DungeonCharacter class"""
-
-    def setUp(self):
-        """Set up a DungeonCharacter instance for testing"""
-        self.x, self.y = 100, 200
-        self.width, self.height = 64, 64
-        self.name = "TestCharacter"
-        self.max_health = 100
-        self.health = 100
-        self.speed = 5
-        self.damage = 10
-        
-        # Create a DungeonCharacter instance
-        self.character = DungeonCharacter(
-            self.x, self.y, self.width, self.height, self.name,
-            self.max_health, self.health, self.speed, self.damage
-        )
-
-    def test_initialization(self):
-        """Test that character is initialized with correct values"""
-        self.assertEqual(self.character.get_x(), self.x)
-        self.assertEqual(self.character.get_y(), self.y)
-        self.assertEqual(self.character.get_width(), self.width)
-        self.assertEqual(self.character.get_height(), self.height)
-        self.assertEqual(self.character.get_name(), self.name)
-        self.assertEqual(self.character.get_max_health(), self.max_health)
-        self.assertEqual(self.character.get_health(), self.health)
-        self.assertEqual(self.character.get_speed(), self.speed)
-        self.assertEqual(self.character.get_damage(), self.damage)
-        self.assertTrue(self.character.is_alive())
-
-    def test_take_damage(self):
-        """Test character taking damage"""
-        initial_health = self.character.get_health()
-        damage = 30
-        
-        # Take damage
-        self.character.take_damage(damage)
-        
-        # Verify health reduction
-        self.assertEqual(self.character.get_health(), initial_health - damage)
-        self.assertTrue(self.character.is_alive())
-
-    def test_take_fatal_damage(self):
-        """Test character taking fatal damage"""
-        fatal_damage = self.character.get_health() + 10
-        
-        # Take fatal damage
-        self.character.take_damage(fatal_damage)
-        
-        # Verify character is dead
-        self.assertEqual(self.character.get_health(), 0)  # Health should be clamped to 0
-        self.assertFalse(self.character.is_alive())
-
-    def test_heal(self):
-        """Test healing the character"""
-        # First take some damage
-        self.character.take_damage(50)
-        damaged_health = self.character.get_health()
-        
-        # Heal partial amount
-        heal_amount = 20
-        self.character.heal(heal_amount)
-        
-        # Verify healing
-        self.assertEqual(self.character.get_health(), damaged_health + heal_amount)
-        
-        # Heal beyond max health
-        large_heal = 100
-        self.character.heal(large_heal)
-        
-        # Verify health is capped at max_health
-        self.assertEqual(self.character.get_health(), self.character.get_max_health())
-
-    def test_attack(self):
-        """Test character attack method"""
-        # Create a mock target
-        mock_target = MagicMock()
-        mock_target.take_damage = MagicMock()
-        
-        # Attack target
-        if hasattr(self.character, "attack"):
-            damage = self.character.attack(mock_target)
-            
-            # Verify damage calculation and target.take_damage called
-            self.assertEqual(damage, self.damage)
-            mock_target.take_damage.assert_called_once_with(self.damage)
-
-    def test_movement(self):
-        """Test character movement"""
-        initial_x = self.character.get_x()
-        initial_y = self.character.get_y()
-        
-        # Move right
-        self.character.move_right(1.0)
-        self.assertGreater(self.character.get_x(), initial_x)
-        
-        # Move left
-        new_x = self.character.get_x()
-        self.character.move_left(1.0)
-        self.assertLess(self.character.get_x(), new_x)
-        
-        # Jump (if implemented)
-        if hasattr(self.character, "jump"):
-            initial_y = self.character.get_y()
-            self.character.jump()
-            # In most implementations, jump sets a negative y velocity
-            self.assertLess(self.character.get_velocity_y(), 0)
-
-    def test_is_alive(self):
-        """Test alive status methods"""
-        # Initially alive
-        self.assertTrue(self.character.is_alive())
-        
-        # Take fatal damage
-        self.character.take_damage(self.character.get_health() + 10)
-        
-        # Should be dead
-        self.assertFalse(self.character.is_alive())
-        
-        # Resurrect
-        self.character.set_health(10)
-        self.assertTrue(self.character.is_alive())
-
-    def test_set_stats(self):
-        """Test setting character stats"""
-        # Set new values
-        new_health = 75
-        new_max_health = 150
-        new_speed = 7
-        new_damage = 15
-        
-        # Update stats
-        self.character.set_health(new_health)
-        self.character.set_max_health(new_max_health)
-        self.character.set_speed(new_speed)
-        self.character.set_damage(new_damage)
-        
-        # Verify changes
-        self.assertEqual(self.character.get_health(), new_health)
-        self.assertEqual(self.character.get_max_health(), new_max_health)
-        self.assertEqual(self.character.get_speed(), new_speed)
-        self.assertEqual(self.character.get_damage(), new_damage)
-        
-        # Test setting health above max health
-        self.character.set_health(new_max_health + 20)
-        self.assertEqual(self.character.get_health(), new_max_health)  # Should be capped
-
-    def test_string_representation(self):
-        """Test string representation of character"""
-        character_str = str(self.character)
-        
-        # Check that string contains important information
-        self.assertIn(self.name, character_str)
-        self.assertIn(f"{self.health}/{self.max_health}", character_str)
-        self.assertIn(str(self.damage), character_str)
-
-
-if __name__ == '__main__':
-    unittest.main()
\ No newline at end of file
+# Character fixtures (shared_character/character) live in conftest.py
+# so all four model test files share them
+
+
+def test_initialization(shared_character):
+    """Test that character is initialized with correct values"""
+    assert shared_character.get_x() == CHAR_X
+    assert shared_character.get_y() == CHAR_Y
+    assert shared_character.get_width() == CHAR_WIDTH
+    assert shared_character.get_height() == CHAR_HEIGHT
+    assert shared_character.get_name() == CHAR_NAME
+    assert shared_character.get_max_health() == CHAR_MAX_HEALTH
+    assert shared_character.get_health() == CHAR_HEALTH
+    assert shared_character.get_speed() == CHAR_SPEED
+    assert shared_character.get_damage() == CHAR_DAMAGE
+    assert shared_character.is_alive()
+
+
+@pytest.mark.skipif(not _CHARACTER_CAPS["attack"], reason="DungeonCharacter has no attack method")
+def test_attack(shared_character):
+    """Test character attack method"""
+    # Create a mock target
+    mock_target = MagicMock()
+    mock_target.take_damage = MagicMock()
+
+    # Attack target
+    damage = shared_character.attack(mock_target)
+
+    # Verify damage calculation and target.take_damage called
+    assert damage == CHAR_DAMAGE
+    mock_target.take_damage.assert_called_once_with(CHAR_DAMAGE)
+
+
+def test_string_representation(shared_character):
+    """Test string representation of character"""
+    character_str = str(shared_character)
+
+    # One scan for name, health and damage instead of three passes
+    assert re.search(
+        f"{CHAR_NAME}.*{CHAR_HEALTH}/{CHAR_MAX_HEALTH}.*{CHAR_DAMAGE}",
+        character_str,
+    )
+
+
+def test_take_damage(character):
+    """Test character taking damage"""
+    initial_health = character.get_health()
+    damage = 30
+
+    # Take damage
+    character.take_damage(damage)
+
+    # Verify health reduction
+    assert character.get_health() == initial_health - damage
+    assert character.is_alive()
+
+
+def test_take_fatal_damage(character):
+    """Test character taking fatal damage"""
+    fatal_damage = character.get_health() + 10
+
+    # Take fatal damage
+    character.take_damage(fatal_damage)
+
+    # Verify character is dead
+    assert character.get_health() == 0  # Health should be clamped to 0
+    assert not character.is_alive()
+
+
+def test_heal(character):
+    """Test healing the character"""
+    # First take some damage
+    character.take_damage(50)
+    damaged_health = character.get_health()
+
+    # Heal partial amount
+    heal_amount = 20
+    character.heal(heal_amount)
+
+    # Verify healing
+    assert character.get_health() == damaged_health + heal_amount
+
+    # Heal beyond max health
+    large_heal = 100
+    character.heal(large_heal)
+
+    # Verify health is capped at max_health
+    assert character.get_health() == character.get_max_health()
+
+
+def test_movement(character):
+    """Test character movement"""
+    initial_x = character.get_x()
+    initial_y = character.get_y()
+
+    # Move right
+    character.move_right(1.0)
+    assert character.get_x() > initial_x
+
+    # Move left
+    new_x = character.get_x()
+    character.move_left(1.0)
+    assert character.get_x() < new_x
+
+    # Jump (if implemented)
+    if _CHARACTER_CAPS["jump"]:
+        initial_y = character.get_y()
+        character.jump()
+        # In most implementations, jump sets a negative y velocity
+        assert character.get_velocity_y() < 0
+
+
+def test_is_alive(character):
+    """Test alive status methods"""
+    # Initially alive
+    assert character.is_alive()
+
+    # Take fatal damage
+    character.take_damage(character.get_health() + 10)
+
+    # Should be dead
+    assert not character.is_alive()
+
+    # Resurrect
+    character.set_health(10)
+    assert character.is_alive()
+
+
+def test_set_stats(character):
+    """Test setting character stats"""
+    # Set new values
+    new_health = 75
+    new_max_health = 150
+    new_speed = 7
+    new_damage = 15
+
+    # Update stats
+    character.set_health(new_health)
+    character.set_max_health(new_max_health)
+    character.set_speed(new_speed)
+    character.set_damage(new_damage)
+
+    # Verify changes
+    assert character.get_health() == new_health
+    assert character.get_max_health() == new_max_health
+    assert character.get_speed() == new_speed
+    assert character.get_damage() == new_damage
+
+    # Test setting health above max health
+    character.set_health(new_max_health + 20)
+    assert character.get_health() == new_max_health  # Should be capped
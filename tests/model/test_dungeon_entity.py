@@ -6,13 +6,41 @@ from src.model.DungeonEntity import DungeonEntity, Direction, AnimationState
 class TestDungeonEntity(unittest.TestCase):
     """Tests for the base DungeonEntity class"""
 
+    # Constructor arguments bound once at class level instead of being
+    # recomputed in setUp for every test
+    x, y = 100, 200
+    width, height = 50, 60
+    name = "TestEntity"
+
+    # Collision companions built once for the class; only self.entity is
+    # fresh per test
+    _overlap = None
+    _no_overlap = None
+
     def setUp(self):
         """Set up a DungeonEntity instance for testing"""
-        self.x, self.y = 100, 200
-        self.width, self.height = 50, 60
-        self.name = "TestEntity"
         self.entity = DungeonEntity(self.x, self.y, self.width, self.height, self.name)
 
+    @classmethod
+    def _collision_companions(cls):
+        """Lazily build and cache the overlapping/non-overlapping pair"""
+        if cls._overlap is None:
+            cls._overlap = DungeonEntity(
+                cls.x + 10,  # Overlap on x-axis
+                cls.y + 10,  # Overlap on y-axis
+                cls.width,
+                cls.height,
+                "OverlappingEntity"
+            )
+            cls._no_overlap = DungeonEntity(
+                cls.x + cls.width + 10,  # No overlap on x-axis
+                cls.y,
+                cls.width,
+                cls.height,
+                "NonOverlappingEntity"
+            )
+        return cls._overlap, cls._no_overlap
+
     def test_initialization(self):
         """Test that entity is initialized with correct values"""
         self.assertEqual(self.entity.get_x(), self.x)
@@ -74,24 +102,8 @@ class TestDungeonEntity(unittest.TestCase):
 
     def test_collision_detection(self):
         """Test collision detection between entities"""
-        # Create another entity that overlaps
-        overlapping_entity = DungeonEntity(
-            self.x + 10,  # Overlap on x-axis
-            self.y + 10,  # Overlap on y-axis
-            self.width,
-            self.height,
-            "OverlappingEntity"
-        )
-        
-        # Create another entity that doesn't overlap
-        non_overlapping_entity = DungeonEntity(
-            self.x + self.width + 10,  # No overlap on x-axis
-            self.y,
-            self.width,
-            self.height,
-            "NonOverlappingEntity"
-        )
-        
+        overlapping_entity, non_overlapping_entity = self._collision_companions()
+
         # Test collision detection
         self.assertTrue(self.entity.collides_with(overlapping_entity))
         self.assertFalse(self.entity.collides_with(non_overlapping_entity))
@@ -128,11 +140,9 @@ class TestDungeonEntity(unittest.TestCase):
     def test_string_representation(self):
         """Test string representation of entity"""
         entity_str = str(self.entity)
-        
-        # Check that string contains important information
-        self.assertIn(self.name, entity_str)
-        self.assertIn(str(self.x), entity_str)
-        self.assertIn(str(self.y), entity_str)
+
+        # One scan for name and position instead of three substring passes
+        self.assertRegex(entity_str, f"{self.name}.*{self.x}.*{self.y}")
 
 
 if __name__ == '__main__':
@@ -1,283 +1,333 @@
-import unittest
+import copy
+import pytest
+from types import SimpleNamespace
 from unittest.mock import MagicMock, patch
-import pygame
-from enum import Enum
+
+# Skip (not fail) collection on environments without SDL, and keep the
+# dlopen of SDL2 out of runs that filter this module away
+pygame = pytest.importorskip("pygame")
+
+from src.model import Game as Game_mod
 from src.model.Game import Game, GameState, HeroType
+from src.model.RoomDungeonSystem import DungeonManager
+
+# pygame-touching tests share one xdist worker so SDL state never races
+pytestmark = pytest.mark.xdist_group(name="pygame")
+
+SCREEN_WIDTH, SCREEN_HEIGHT = 800, 600
+
+# Prototype mocks built once at import; tests deep-copy them instead of
+# paying mock-graph construction + attribute seeding per test
+_HERO_PROTO = MagicMock(**{
+    "is_alive": True,
+    "get_serializable_state.return_value": {"health": 100, "position": [100, 200]},
+})
+_PROJECTILE_MANAGER_PROTO = MagicMock()
+_MONSTER_PROTO = MagicMock()
+
+# One spec'd dungeon mock shared by every test: the room returned by
+# get_current_room is materialized once, so repeated
+# dungeon.get_current_room().draw lookups never rebuild child mocks.
+# The game fixture clears call history instead of reconstructing.
+_ROOM_MOCK = MagicMock()
+_DUNGEON_MOCK = MagicMock(spec=DungeonManager)
+_DUNGEON_MOCK.get_current_room.return_value = _ROOM_MOCK
+
+
+@pytest.fixture(scope="module")
+def pygame_env():
+    """Initialize SDL once for the whole module instead of per test"""
+    pygame.init()
+    yield
+    pygame.quit()
+
+
+@pytest.fixture(autouse=True)
+def mock_event_get():
+    """Patch the event queue for every test; tests reassign return_value"""
+    with patch.object(pygame.event, 'get', return_value=[]) as mock:
+        yield mock
+
+
+@pytest.fixture(autouse=True)
+def mock_key_get_pressed():
+    """Patch the pressed-key snapshot for every test"""
+    with patch.object(pygame.key, 'get_pressed') as mock:
+        yield mock
+
+
+@pytest.fixture
+def mock_hero_factory():
+    """Patch HeroFactory for the tests that drive hero creation"""
+    with patch.object(Game_mod, 'HeroFactory') as mock:
+        yield mock
+
+
+@pytest.fixture(scope="module")
+def screen(pygame_env):
+    """One shared screen surface: tests never read pixels back, so the
+    ~2 MB SDL buffer doesn't need reallocating per test"""
+    return pygame.Surface((SCREEN_WIDTH, SCREEN_HEIGHT))
+
+
+@pytest.fixture
+def bare_game(pygame_env):
+    """Minimal Game shell for the _handle_events tests, which only touch
+    state and the running/selection flags; skips the heavyweight
+    __init__ (menus, dungeon, tileset)"""
+    game = Game.__new__(Game)
+    game.state = GameState.MENU
+    game._running = True
+    game._hero_selection_made = False
+    game._selected_hero_type = None
+    # Keep Game.__del__ -> cleanup() quiet on the partial instance
+    game.cleanup = lambda: None
+    return game
+
+
+@pytest.fixture
+def game(screen):
+    """Fresh Game instance against the shared dungeon/room mocks"""
+    # Reuse the shared dungeon mock; only call counts are per-test
+    _DUNGEON_MOCK.reset_mock()
+    _ROOM_MOCK.reset_mock()
+    return Game(screen, SCREEN_WIDTH, SCREEN_HEIGHT)
+
+
+def test_initialization(game, screen):
+    """Test game initialization"""
+    # Check initial state
+    assert game.state == GameState.MENU
+    assert not game._hero_selection_made
+    assert game._selected_hero_type is None
+
+    # Screen parameters should be set
+    assert game.screen == screen
+    assert game.screen_width == SCREEN_WIDTH
+    assert game.screen_height == SCREEN_HEIGHT
+
+    # Clock should be initialized
+    assert isinstance(game.clock, pygame.time.Clock)
+
+
+def test_initialize_game(game, mock_hero_factory):
+    """Test game initialization process"""
+    # Set up for initialization
+    game._hero_selection_made = True
+    game._selected_hero_type = HeroType.KNIGHT
+
+    # Create mock hero and factory
+    mock_hero = MagicMock()
+    mock_hero_factory.create_hero.return_value = mock_hero
+
+    # Initialize game
+    game._initialize_game()
+
+    # Hero factory should be called to create hero
+    mock_hero_factory.create_hero.assert_called_once_with(
+        HeroType.KNIGHT,
+        game.screen_width // 2,
+        game.screen_height // 2
+    )
+
+    # Hero should be set
+    assert game.hero == mock_hero
+
+    # Game state should change to PLAYING
+    assert game.state == GameState.PLAYING
+
+
+def test_handle_events_quit(bare_game, mock_event_get):
+    """Test handling quit event"""
+    # Create a quit event
+    quit_event = pygame.event.Event(pygame.QUIT)
+
+    # Set running flag
+    bare_game._running = True
+
+    # Handle event with mocked pygame.event.get
+    mock_event_get.return_value = [quit_event]
+    bare_game._handle_events()
+
+    # Game should stop running
+    assert not bare_game._running
+
+
+@pytest.mark.parametrize("key,expected_type", [
+    (pygame.K_1, HeroType.KNIGHT),
+    (pygame.K_2, HeroType.ARCHER),
+    (pygame.K_3, HeroType.CLERIC),
+])
+def test_handle_events_hero_selection(bare_game, mock_event_get, key, expected_type):
+    """Test handling hero selection events"""
+    # Set bare_game to HERO_SELECTION state
+    bare_game.state = GameState.HERO_SELECTION
+
+    # Press the number key for this hero
+    mock_event_get.return_value = [pygame.event.Event(pygame.KEYDOWN, key=key)]
+    bare_game._handle_events()
+
+    assert bare_game._selected_hero_type == expected_type
+    assert bare_game._hero_selection_made
+
+
+def test_handle_events_playing(bare_game, mock_event_get):
+    """Test handling events in PLAYING state"""
+    # Set up bare_game in PLAYING state with mock hero
+    bare_game.state = GameState.PLAYING
+    bare_game.hero = copy.deepcopy(_HERO_PROTO)
+
+    # Create keydown event for ESC key (pause)
+    esc_event = pygame.event.Event(pygame.KEYDOWN, key=pygame.K_ESCAPE)
+
+    # Handle event
+    mock_event_get.return_value = [esc_event]
+    bare_game._handle_events()
+
+    # Game should be paused
+    assert bare_game.state == GameState.PAUSED
+
+    # Another ESC event to unpause
+    bare_game._handle_events()
+
+    # Game should resume
+    assert bare_game.state == GameState.PLAYING
+
+
+def test_handle_events_game_over(bare_game, mock_event_get):
+    """Test handling events in GAME_OVER state"""
+    # Set bare_game to GAME_OVER state
+    bare_game.state = GameState.GAME_OVER
+
+    # Create keydown event for RETURN key (restart)
+    return_event = pygame.event.Event(pygame.KEYDOWN, key=pygame.K_RETURN)
+
+    # Handle event
+    mock_event_get.return_value = [return_event]
+    bare_game._handle_events()
+
+    # Game should return to menu
+    assert bare_game.state == GameState.MENU
+
+
+def test_handle_player_input(game, mock_key_get_pressed):
+    """Test handling player input"""
+    # Set up game in PLAYING state with mock hero
+    game.state = GameState.PLAYING
+    game.hero = copy.deepcopy(_HERO_PROTO)
+
+    # Mock key presses
+    mock_keys = {pygame.K_a: True, pygame.K_d: False}
+    mock_key_get_pressed.return_value = mock_keys
+
+    # Handle input
+    game._handle_player_input(1/60)  # dt = 1/60
+
+    # Hero's handle_input should be called
+    game.hero.handle_input.assert_called_once_with(mock_keys, 1/60)
+
+
+def test_update_playing(game):
+    """Test updating game in PLAYING state"""
+    # Set up game in PLAYING state with mock hero
+    game.state = GameState.PLAYING
+    game.hero = copy.deepcopy(_HERO_PROTO)
+    game.dungeon = _DUNGEON_MOCK
+    game.projectile_manager = copy.deepcopy(_PROJECTILE_MANAGER_PROTO)
+    game.monsters = []
+
+    # Update game
+    game._update(1/60)  # dt = 1/60
+
+    # Hero should be updated
+    game.hero.update.assert_called_once_with(1/60)
+
+    # Dungeon should be updated
+    game.dungeon.update_current_room_interactions.assert_called_once()
+
+    # Projectile manager should be updated
+    game.projectile_manager.update.assert_called_once_with(1/60)
+
+
+def test_update_hero_death(game):
+    """Test hero death state transition"""
+    # Set up game in PLAYING state with dead hero. Nothing here is
+    # asserted on, so plain attribute bags beat MagicMock's lazy
+    # child-mock creation on every attribute touch inside _update
+    game.state = GameState.PLAYING
+    game.hero = SimpleNamespace(is_alive=False, update=lambda dt: None)
+    game.dungeon = SimpleNamespace(update_current_room_interactions=lambda: None)
+    game.projectile_manager = SimpleNamespace(update=lambda dt: None)
+    game.monsters = []
+
+    # Update game
+    game._update(1/60)  # dt = 1/60
+
+    # Game state should change to GAME_OVER
+    assert game.state == GameState.GAME_OVER
+
+
+def test_save_game_state(game):
+    """Test saving game state"""
+    # Set up game with mock components
+    game.hero = copy.deepcopy(_HERO_PROTO)
+
+    # Save game state
+    state = game.save_game_state()
+
+    # Should include hero state
+    assert "hero" in state
+    assert state["hero"] == {"health": 100, "position": [100, 200]}
+
+
+def test_load_game_state(game, mock_hero_factory):
+    """Test loading game state"""
+    # Create a mock hero
+    mock_hero = MagicMock()
+
+    # Set up hero factory to return mock hero
+    mock_hero_factory.create_hero.return_value = mock_hero
+
+    # Create game state to load
+    state = {
+        "hero": {
+            "type": "KNIGHT",
+            "health": 80,
+            "position": [150, 250]
+        }
+    }
+
+    # Load state
+    result = game.load_game_state(state)
+
+    # Should return True for successful load
+    assert result
+
+    # Hero should be created and state loaded
+    mock_hero_factory.create_hero.assert_called_once()
+    mock_hero.load_state.assert_called_once_with(state["hero"])
+
+    # Game should be in PLAYING state
+    assert game.state == GameState.PLAYING
+
+
+def test_render(game):
+    """Test game rendering"""
+    # Set up game with mock components
+    game.hero = copy.deepcopy(_HERO_PROTO)
+    game.dungeon = _DUNGEON_MOCK
+    game.current_room = MagicMock()
+    game.projectile_manager = copy.deepcopy(_PROJECTILE_MANAGER_PROTO)
+    game.monsters = [copy.deepcopy(_MONSTER_PROTO)]
+
+    # Set game to PLAYING state
+    game.state = GameState.PLAYING
 
+    # Render game
+    game._render()
 
-class TestGame(unittest.TestCase):
-    """Tests for the Game class"""
-
-    def setUp(self):
-        """Set up test environment"""
-        pygame.init()
-        
-        # Create mock screen
-        self.screen_width = 800
-        self.screen_height = 600
-        self.screen = pygame.Surface((self.screen_width, self.screen_height))
-        
-        # Create game instance
-        self.game = Game(self.screen, self.screen_width, self.screen_height)
-
-    def tearDown(self):
-        """Clean up pygame"""
-        pygame.quit()
-
-    def test_initialization(self):
-        """Test game initialization"""
-        # Check initial state
-        self.assertEqual(self.game.state, GameState.MENU)
-        self.assertFalse(self.game._hero_selection_made)
-        self.assertIsNone(self.game._selected_hero_type)
-        
-        # Screen parameters should be set
-        self.assertEqual(self.game.screen, self.screen)
-        self.assertEqual(self.game.screen_width, self.screen_width)
-        self.assertEqual(self.game.screen_height, self.screen_height)
-        
-        # Clock should be initialized
-        self.assertIsInstance(self.game.clock, pygame.time.Clock)
-
-    @patch('src.model.Game.HeroFactory')
-    def test_initialize_game(self, mock_hero_factory):
-        """Test game initialization process"""
-        # Set up for initialization
-        self.game._hero_selection_made = True
-        self.game._selected_hero_type = HeroType.KNIGHT
-        
-        # Create mock hero and factory
-        mock_hero = MagicMock()
-        mock_hero_factory.create_hero.return_value = mock_hero
-        
-        # Initialize game
-        self.game._initialize_game()
-        
-        # Hero factory should be called to create hero
-        mock_hero_factory.create_hero.assert_called_once_with(
-            HeroType.KNIGHT, 
-            self.game.screen_width // 2, 
-            self.game.screen_height // 2
-        )
-        
-        # Hero should be set
-        self.assertEqual(self.game.hero, mock_hero)
-        
-        # Game state should change to PLAYING
-        self.assertEqual(self.game.state, GameState.PLAYING)
-
-    def test_handle_events_quit(self):
-        """Test handling quit event"""
-        # Create a quit event
-        quit_event = pygame.event.Event(pygame.QUIT)
-        
-        # Set running flag
-        self.game._running = True
-        
-        # Handle event with mocked pygame.event.get
-        with patch('pygame.event.get', return_value=[quit_event]):
-            self.game._handle_events()
-        
-        # Game should stop running
-        self.assertFalse(self.game._running)
-
-    def test_handle_events_hero_selection(self):
-        """Test handling hero selection events"""
-        # Set game to HERO_SELECTION state
-        self.game.state = GameState.HERO_SELECTION
-        
-        # Create keydown events for number keys
-        key1_event = pygame.event.Event(pygame.KEYDOWN, key=pygame.K_1)
-        key2_event = pygame.event.Event(pygame.KEYDOWN, key=pygame.K_2)
-        key3_event = pygame.event.Event(pygame.KEYDOWN, key=pygame.K_3)
-        
-        # Test knight selection (key 1)
-        with patch('pygame.event.get', return_value=[key1_event]):
-            self.game._handle_events()
-        
-        self.assertEqual(self.game._selected_hero_type, HeroType.KNIGHT)
-        self.assertTrue(self.game._hero_selection_made)
-        
-        # Reset and test archer selection (key 2)
-        self.game._hero_selection_made = False
-        self.game._selected_hero_type = None
-        
-        with patch('pygame.event.get', return_value=[key2_event]):
-            self.game._handle_events()
-        
-        self.assertEqual(self.game._selected_hero_type, HeroType.ARCHER)
-        self.assertTrue(self.game._hero_selection_made)
-        
-        # Reset and test cleric selection (key 3)
-        self.game._hero_selection_made = False
-        self.game._selected_hero_type = None
-        
-        with patch('pygame.event.get', return_value=[key3_event]):
-            self.game._handle_events()
-        
-        self.assertEqual(self.game._selected_hero_type, HeroType.CLERIC)
-        self.assertTrue(self.game._hero_selection_made)
-
-    def test_handle_events_playing(self):
-        """Test handling events in PLAYING state"""
-        # Set up game in PLAYING state with mock hero
-        self.game.state = GameState.PLAYING
-        self.game.hero = MagicMock()
-        self.game.hero.is_alive = True
-        
-        # Create keydown event for ESC key (pause)
-        esc_event = pygame.event.Event(pygame.KEYDOWN, key=pygame.K_ESCAPE)
-        
-        # Handle event
-        with patch('pygame.event.get', return_value=[esc_event]):
-            self.game._handle_events()
-        
-        # Game should be paused
-        self.assertEqual(self.game.state, GameState.PAUSED)
-        
-        # Create another ESC event to unpause
-        with patch('pygame.event.get', return_value=[esc_event]):
-            self.game._handle_events()
-        
-        # Game should resume
-        self.assertEqual(self.game.state, GameState.PLAYING)
-
-    def test_handle_events_game_over(self):
-        """Test handling events in GAME_OVER state"""
-        # Set game to GAME_OVER state
-        self.game.state = GameState.GAME_OVER
-        
-        # Create keydown event for RETURN key (restart)
-        return_event = pygame.event.Event(pygame.KEYDOWN, key=pygame.K_RETURN)
-        
-        # Handle event
-        with patch('pygame.event.get', return_value=[return_event]):
-            self.game._handle_events()
-        
-        # Game should return to menu
-        self.assertEqual(self.game.state, GameState.MENU)
-
-    @patch('src.model.Game.pygame.key.get_pressed')
-    def test_handle_player_input(self, mock_get_pressed):
-        """Test handling player input"""
-        # Set up game in PLAYING state with mock hero
-        self.game.state = GameState.PLAYING
-        self.game.hero = MagicMock()
-        self.game.hero.is_alive = True
-        
-        # Mock key presses
-        mock_keys = {pygame.K_a: True, pygame.K_d: False}
-        mock_get_pressed.return_value = mock_keys
-        
-        # Handle input
-        self.game._handle_player_input(1/60)  # dt = 1/60
-        
-        # Hero's handle_input should be called
-        self.game.hero.handle_input.assert_called_once_with(mock_keys, 1/60)
-
-    def test_update_playing(self):
-        """Test updating game in PLAYING state"""
-        # Set up game in PLAYING state with mock hero
-        self.game.state = GameState.PLAYING
-        self.game.hero = MagicMock()
-        self.game.hero.is_alive = True
-        self.game.dungeon = MagicMock()
-        self.game.projectile_manager = MagicMock()
-        self.game.monsters = []
-        
-        # Update game
-        self.game._update(1/60)  # dt = 1/60
-        
-        # Hero should be updated
-        self.game.hero.update.assert_called_once_with(1/60)
-        
-        # Dungeon should be updated
-        self.game.dungeon.update_current_room_interactions.assert_called_once()
-        
-        # Projectile manager should be updated
-        self.game.projectile_manager.update.assert_called_once_with(1/60)
-
-    def test_update_hero_death(self):
-        """Test hero death state transition"""
-        # Set up game in PLAYING state with dead hero
-        self.game.state = GameState.PLAYING
-        self.game.hero = MagicMock()
-        self.game.hero.is_alive = False
-        self.game.dungeon = MagicMock()
-        self.game.projectile_manager = MagicMock()
-        self.game.monsters = []
-        
-        # Update game
-        self.game._update(1/60)  # dt = 1/60
-        
-        # Game state should change to GAME_OVER
-        self.assertEqual(self.game.state, GameState.GAME_OVER)
-
-    def test_save_game_state(self):
-        """Test saving game state"""
-        # Set up game with mock components
-        self.game.hero = MagicMock()
-        self.game.hero.get_serializable_state.return_value = {"health": 100, "position": [100, 200]}
-        
-        # Save game state
-        state = self.game.save_game_state()
-        
-        # Should include hero state
-        self.assertIn("hero", state)
-        self.assertEqual(state["hero"], {"health": 100, "position": [100, 200]})
-
-    def test_load_game_state(self):
-        """Test loading game state"""
-        # Create a mock hero
-        mock_hero = MagicMock()
-        
-        # Set up hero factory to return mock hero
-        with patch('src.model.Game.HeroFactory') as mock_factory:
-            mock_factory.create_hero.return_value = mock_hero
-            
-            # Create game state to load
-            state = {
-                "hero": {
-                    "type": "KNIGHT",
-                    "health": 80,
-                    "position": [150, 250]
-                }
-            }
-            
-            # Load state
-            result = self.game.load_game_state(state)
-            
-            # Should return True for successful load
-            self.assertTrue(result)
-            
-            # Hero should be created and state loaded
-            mock_factory.create_hero.assert_called_once()
-            mock_hero.load_state.assert_called_once_with(state["hero"])
-            
-            # Game should be in PLAYING state
-            self.assertEqual(self.game.state, GameState.PLAYING)
-
-    def test_render(self):
-        """Test game rendering"""
-        # Set up game with mock components
-        self.game.hero = MagicMock()
-        self.game.dungeon = MagicMock()
-        self.game.current_room = MagicMock()
-        self.game.projectile_manager = MagicMock()
-        self.game.monsters = [MagicMock()]
-        
-        # Set game to PLAYING state
-        self.game.state = GameState.PLAYING
-        
-        # Render game
-        self.game._render()
-        
-        # Components should be rendered
-        self.game.dungeon.get_current_room().draw.assert_called_once()
-        self.game.hero.render.assert_called_once()
-        self.game.monsters[0].render.assert_called_once()
-        self.game.projectile_manager.render.assert_called_once()
-
-
-if __name__ == '__main__':
-    unittest.main()
\ No newline at end of file
+    # Components should be rendered
+    game.dungeon.get_current_room().draw.assert_called_once()
+    game.hero.render.assert_called_once()
+    game.monsters[0].render.assert_called_once()
+    game.projectile_manager.render.assert_called_once()
@@ -1,72 +1,51 @@
-import unittest
+import pytest
 from src.model.HeroFactory import HeroFactory, HeroType, DungeonHeroFactory
 from src.model.knight import Knight
 from src.model.archer import Archer
 from src.model.cleric import Cleric
 
 
-class TestHeroFactory(unittest.TestCase):
-    """Tests for the HeroFactory class"""
+@pytest.fixture(scope="module")
+def factory():
+    """Hero factory under test; module-scoped since no test mutates it"""
+    return DungeonHeroFactory()
 
-    def setUp(self):
-        """Set up a hero factory for testing"""
-        self.factory = DungeonHeroFactory()
 
-    def test_supported_types(self):
-        """Test that factory supports expected hero types"""
-        supported_types = self.factory.get_supported_types()
-        
-        # Check that all expected types are supported
-        self.assertIn(HeroType.KNIGHT, supported_types)
-        self.assertIn(HeroType.ARCHER, supported_types)
-        self.assertIn(HeroType.CLERIC, supported_types)
-        
-        # Check count matches expected
-        self.assertEqual(len(supported_types), 3)
+def test_supported_types(factory):
+    """Test that factory supports expected hero types"""
+    supported_types = factory.get_supported_types()
 
-    def test_create_knight(self):
-        """Test creation of Knight hero"""
-        x, y = 100, 200
-        knight = self.factory.create_hero(HeroType.KNIGHT, x, y)
-        
-        # Check type and position
-        self.assertIsInstance(knight, Knight)
-        self.assertEqual(knight.get_x(), x)
-        self.assertEqual(knight.get_y(), y)
-        self.assertEqual(knight.get_hero_type(), "knight")
+    # Check that all expected types are supported
+    assert HeroType.KNIGHT in supported_types
+    assert HeroType.ARCHER in supported_types
+    assert HeroType.CLERIC in supported_types
 
-    def test_create_archer(self):
-        """Test creation of Archer hero"""
-        x, y = 150, 250
-        archer = self.factory.create_hero(HeroType.ARCHER, x, y)
-        
-        # Check type and position
-        self.assertIsInstance(archer, Archer)
-        self.assertEqual(archer.get_x(), x)
-        self.assertEqual(archer.get_y(), y)
-        self.assertEqual(archer.get_hero_type(), "archer")
+    # Check count matches expected
+    assert len(supported_types) == 3
 
-    def test_create_cleric(self):
-        """Test creation of Cleric hero"""
-        x, y = 200, 300
-        cleric = self.factory.create_hero(HeroType.CLERIC, x, y)
-        
-        # Check type and position
-        self.assertIsInstance(cleric, Cleric)
-        self.assertEqual(cleric.get_x(), x)
-        self.assertEqual(cleric.get_y(), y)
-        self.assertEqual(cleric.get_hero_type(), "cleric")
 
-    def test_unsupported_type(self):
-        """Test that creating an unsupported hero type raises an error"""
-        # Create a fake HeroType that's not supported
-        class FakeHeroType(HeroType):
-            FAKE = "fake"
-            
-        # Try to create a hero with unsupported type
-        with self.assertRaises(ValueError):
-            self.factory.create_hero(FakeHeroType.FAKE, 0, 0)
+@pytest.mark.parametrize("hero_type,hero_cls,type_name,x,y", [
+    (HeroType.KNIGHT, Knight, "knight", 100, 200),
+    (HeroType.ARCHER, Archer, "archer", 150, 250),
+    (HeroType.CLERIC, Cleric, "cleric", 200, 300),
+])
+def test_create_hero(factory, hero_type, hero_cls, type_name, x, y):
+    """Test creation of each supported hero type"""
+    hero = factory.create_hero(hero_type, x, y)
 
+    # Check type and position
+    assert isinstance(hero, hero_cls)
+    assert hero.get_x() == x
+    assert hero.get_y() == y
+    assert hero.get_hero_type() == type_name
 
-if __name__ == '__main__':
-    unittest.main()
\ No newline at end of file
+
+def test_unsupported_type(factory):
+    """Test that creating an unsupported hero type raises an error"""
+    # Create a fake HeroType that's not supported
+    class FakeHeroType(HeroType):
+        FAKE = "fake"
+
+    # Try to create a hero with unsupported type
+    with pytest.raises(ValueError):
+        factory.create_hero(FakeHeroType.FAKE, 0, 0)
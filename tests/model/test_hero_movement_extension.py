@@ -1,14 +1,26 @@
-
-import unittest
-from unittest.mock import MagicMock, patch
+import math
+import pytest
+from types import SimpleNamespace
 import pygame
 from src.model.Hero_Movement_Extension import HeroMovementExtension
 from src.model.DungeonEntity import Direction, AnimationState
 
+# pygame-touching tests share one xdist worker so SDL state never races
+pytestmark = pytest.mark.xdist_group(name="pygame")
+
+# Key codes bound once at module scope so the per-test keys dicts don't
+# re-resolve pygame attributes
+K_A, K_D, K_LSHIFT, K_SPACE, K_X = (
+    pygame.K_a, pygame.K_d, pygame.K_LSHIFT, pygame.K_SPACE, pygame.K_x
+)
+
+# All keys released; tests overlay just the keys they press
+_BASE_KEYS = dict.fromkeys((K_A, K_D, K_LSHIFT, K_SPACE, K_X), False)
+
 
 class HeroWithMovement(HeroMovementExtension):
     """Test class that inherits from HeroMovementExtension mixin"""
-    
+
     def __init__(self):
         # Initialize properties that would normally be in a Hero class
         self.x = 100
@@ -28,221 +40,225 @@ class HeroWithMovement(HeroMovementExtension):
             AnimationState.RUNNING: 8,
             AnimationState.ATTACKING: 6
         }
-        
+
         # Initialize movement extension
         self.initialize_movement_capabilities()
-    
+
     def calculate_damage(self, target):
         """Mock implementation of calculate_damage"""
         return 10
 
 
-class TestHeroMovementExtension(unittest.TestCase):
-    """Tests for the HeroMovementExtension mixin class"""
-
-    def setUp(self):
-        """Set up a hero with movement capabilities"""
-        # Initialize pygame for key constants
-        pygame.init()
-        
-        # Create hero with movement extension
-        self.hero = HeroWithMovement()
-
-    def tearDown(self):
-        """Clean up pygame"""
-        pygame.quit()
-
-    def test_initialization(self):
-        """Test that movement properties are initialized correctly"""
-        # Check jumping properties
-        self.assertFalse(self.hero.is_jumping)
-        self.assertFalse(self.hero.is_falling)
-        self.assertEqual(self.hero.jump_velocity, 15)
-        self.assertEqual(self.hero.jump_height, 200)
-        self.assertEqual(self.hero.y_velocity, 0)
-        self.assertEqual(self.hero.gravity, 0.8)
-        self.assertEqual(self.hero.ground_y, self.hero.y)
-        
-        # Check running properties
-        self.assertFalse(self.hero.is_running)
-        self.assertEqual(self.hero.run_speed, self.hero.speed * 1.5)
-        self.assertEqual(self.hero.run_threshold, 10)
-        self.assertEqual(self.hero.run_counter, 0)
-        
-        # Check running attack properties
-        self.assertFalse(self.hero.is_running_attacking)
-        self.assertEqual(self.hero.running_attack_damage_multiplier, 1.3)
-        
-        # Check frame rates were updated
-        self.assertEqual(self.hero.frame_rates[AnimationState.RUNNING], 5)
-        self.assertEqual(self.hero.frame_rates[AnimationState.JUMPING], 4)
-        self.assertEqual(self.hero.frame_rates[AnimationState.FALLING], 4)
-        self.assertEqual(self.hero.frame_rates[AnimationState.RUNNING_ATTACK], 5)
-
-    def test_jump_mechanics(self):
-        """Test jumping mechanics"""
-        # Initial state
-        self.assertFalse(self.hero.is_jumping)
-        self.assertFalse(self.hero.is_falling)
-        initial_y = self.hero.y
-        
-        # Start jump
-        self.hero.start_jump()
-        
-        # Should now be jumping
-        self.assertTrue(self.hero.is_jumping)
-        self.assertFalse(self.hero.is_falling)
-        self.assertEqual(self.hero.y_velocity, -15)  # Initial upward velocity
-        
-        # Update movement (should move upward)
-        self.hero.update_movement(1.0)
-        self.assertLess(self.hero.y, initial_y)  # Y should decrease (moving up)
-        
-        # Keep updating until reaching apex
-        while self.hero.is_jumping:
-            self.hero.update_movement(1.0)
-        
-        # Should now be falling
-        self.assertFalse(self.hero.is_jumping)
-        self.assertTrue(self.hero.is_falling)
-        self.assertGreaterEqual(self.hero.y_velocity, 0)  # Velocity should be positive (downward)
-        
-        # Keep updating until reaching ground
-        while self.hero.is_falling:
-            self.hero.update_movement(1.0)
-        
-        # Should now be back on ground
-        self.assertFalse(self.hero.is_jumping)
-        self.assertFalse(self.hero.is_falling)
-        self.assertEqual(self.hero.y, self.hero.ground_y)
-        self.assertEqual(self.hero.y_velocity, 0)
-
-    def test_running_mechanics(self):
-        """Test running mechanics"""
-        # Create mock keys dictionary
-        keys = {
-            pygame.K_a: False,
-            pygame.K_d: True,
-            pygame.K_LSHIFT: True,
-            pygame.K_SPACE: False,
-            pygame.K_x: False
-        }
-        
-        # Initial state
-        self.assertFalse(self.hero.is_running)
-        self.assertEqual(self.hero.run_counter, 0)
-        
-        # Not enough frames for running yet
-        self.hero.handle_extended_input(keys, 1.0)
-        self.assertFalse(self.hero.is_running)
-        self.assertEqual(self.hero.run_counter, 1)
-        
-        # Simulate multiple frames to reach run threshold
-        for _ in range(self.hero.run_threshold - 1):
-            self.hero.handle_extended_input(keys, 1.0)
-        
-        # Should now be running
-        self.assertTrue(self.hero.is_running)
-        self.assertEqual(self.hero.run_counter, self.hero.run_threshold)
-        
-        # Stop running when shift is released
-        keys[pygame.K_LSHIFT] = False
-        self.hero.handle_extended_input(keys, 1.0)
-        self.assertFalse(self.hero.is_running)
-        self.assertEqual(self.hero.run_counter, 0)
-
-    def test_running_attack(self):
-        """Test running attack mechanics"""
-        # Set up for running attack
-        self.hero.is_running = True
-        self.hero.is_running_attacking = False
-        self.hero.is_attacking = False
-        
-        # Create mock keys dictionary
-        keys = {
-            pygame.K_a: False,
-            pygame.K_d: True,
-            pygame.K_LSHIFT: True,
-            pygame.K_SPACE: False,
-            pygame.K_x: True  # X key for running attack
-        }
-        
-        # Perform running attack
-        self.hero.handle_extended_input(keys, 1.0)
-        
-        # Should now be running attacking
-        self.assertTrue(self.hero.is_running_attacking)
-        self.assertFalse(self.hero.attack_complete)
-        self.assertEqual(len(self.hero.hit_targets), 0)  # Should be cleared
-        
-        # Check hitbox creation
-        hitbox = self.hero.get_running_attack_hitbox()
-        self.assertIsNotNone(hitbox)
-        self.assertIsInstance(hitbox, pygame.Rect)
-        
-        # Hitbox should be in front of character for right direction
-        self.assertGreater(hitbox.right, self.hero.x)
-        
-        # Check damage calculation
-        mock_target = MagicMock()
-        damage = self.hero.calculate_running_attack_damage(mock_target)
-        expected_damage = int(10 * self.hero.running_attack_damage_multiplier)  # 10 is from mock calculate_damage
-        self.assertEqual(damage, expected_damage)
-        
-        # Check animation state update
-        self.hero._update_extended_animation_state()
-        self.assertEqual(self.hero.animation_state, AnimationState.RUNNING_ATTACK)
-
-    def test_animation_state_priorities(self):
-        """Test animation state priorities"""
-        # Set various states
-        self.hero.is_running_attacking = True
-        self.hero.is_jumping = True
-        self.hero.is_falling = False
-        self.hero.is_running = True
-        
-        # Running attack should have highest priority
-        self.hero._update_extended_animation_state()
-        self.assertEqual(self.hero.animation_state, AnimationState.RUNNING_ATTACK)
-        
-        # Turn off running attack, jumping should be next
-        self.hero.is_running_attacking = False
-        self.hero._update_extended_animation_state()
-        self.assertEqual(self.hero.animation_state, AnimationState.JUMPING)
-        
-        # Turn off jumping, falling should be next
-        self.hero.is_jumping = False
-        self.hero.is_falling = True
-        self.hero._update_extended_animation_state()
-        self.assertEqual(self.hero.animation_state, AnimationState.FALLING)
-        
-        # Turn off falling, running should be next
-        self.hero.is_falling = False
-        self.hero._update_extended_animation_state()
-        self.assertEqual(self.hero.animation_state, AnimationState.RUNNING)
-
-    def test_handle_input_when_dead(self):
-        """Test that input is ignored when character is dead"""
-        # Set character as dead
-        self.hero.is_alive = False
-        
-        # Create mock keys dictionary with all keys pressed
-        keys = {
-            pygame.K_a: True,
-            pygame.K_d: True,
-            pygame.K_LSHIFT: True,
-            pygame.K_SPACE: True,
-            pygame.K_x: True
-        }
-        
-        # Handle input
-        self.hero.handle_extended_input(keys, 1.0)
-        
-        # No state should change
-        self.assertFalse(self.hero.is_jumping)
-        self.assertFalse(self.hero.is_running)
-        self.assertFalse(self.hero.is_running_attacking)
-
-
-if __name__ == '__main__':
-    unittest.main()
\ No newline at end of file
+@pytest.fixture(scope="module", autouse=True)
+def pygame_env():
+    """Initialize SDL once for the whole module instead of per test"""
+    pygame.init()
+    yield
+    pygame.quit()
+
+
+@pytest.fixture(scope="module")
+def pristine_hero():
+    """Single hero shared by tests that never mutate it"""
+    return HeroWithMovement()
+
+
+@pytest.fixture
+def hero():
+    """Fresh hero for tests that mutate movement state"""
+    return HeroWithMovement()
+
+
+def test_initialization(pristine_hero):
+    """Test that movement properties are initialized correctly"""
+    hero = pristine_hero
+
+    # Check jumping properties
+    assert not hero.is_jumping
+    assert not hero.is_falling
+    assert hero.jump_velocity == 15
+    assert hero.jump_height == 200
+    assert hero.y_velocity == 0
+    assert hero.gravity == 0.8
+    assert hero.ground_y == hero.y
+
+    # Check running properties
+    assert not hero.is_running
+    assert hero.run_speed == hero.speed * 1.5
+    assert hero.run_threshold == 10
+    assert hero.run_counter == 0
+
+    # Check running attack properties
+    assert not hero.is_running_attacking
+    assert hero.running_attack_damage_multiplier == 1.3
+
+    # Check frame rates were updated
+    assert hero.frame_rates[AnimationState.RUNNING] == 5
+    assert hero.frame_rates[AnimationState.JUMPING] == 4
+    assert hero.frame_rates[AnimationState.FALLING] == 4
+    assert hero.frame_rates[AnimationState.RUNNING_ATTACK] == 5
+
+
+def test_jump_mechanics(hero):
+    """Test jumping mechanics"""
+    # Initial state
+    assert not hero.is_jumping
+    assert not hero.is_falling
+    initial_y = hero.y
+
+    # Start jump
+    hero.start_jump()
+
+    # Should now be jumping
+    assert hero.is_jumping
+    assert not hero.is_falling
+    assert hero.y_velocity == -15  # Initial upward velocity
+
+    # Update movement (should move upward)
+    hero.update_movement(1.0)
+    assert hero.y < initial_y  # Y should decrease (moving up)
+
+    # The rise lasts ceil(jump_velocity / gravity) frames under constant
+    # gravity, so step a bounded number of frames instead of looping on
+    # is_jumping; an unbounded loop would hang if the physics regressed
+    frames_up = math.ceil(hero.jump_velocity / hero.gravity)
+    update = hero.update_movement  # bound once for both stepping loops
+    for _ in range(frames_up + 1):
+        if not hero.is_jumping:
+            break
+        update(1.0)
+
+    # Should now be falling
+    assert not hero.is_jumping
+    assert hero.is_falling
+    assert hero.y_velocity >= 0  # Velocity should be positive (downward)
+
+    # Falling from the apex takes at most sqrt(2 * jump_height / gravity)
+    # frames; same bounded stepping as the rise
+    frames_down = math.ceil(math.sqrt(2 * hero.jump_height / hero.gravity))
+    for _ in range(frames_down + 1):
+        if not hero.is_falling:
+            break
+        update(1.0)
+
+    # Should now be back on ground
+    assert not hero.is_jumping
+    assert not hero.is_falling
+    assert hero.y == hero.ground_y
+    assert hero.y_velocity == 0
+
+
+def test_running_mechanics(hero):
+    """Test running mechanics"""
+    # Create mock keys dictionary
+    keys = {**_BASE_KEYS, K_D: True, K_LSHIFT: True}
+
+    # Initial state
+    assert not hero.is_running
+    assert hero.run_counter == 0
+
+    # Bind once; the loop below calls it run_threshold times
+    handle = hero.handle_extended_input
+
+    # Not enough frames for running yet
+    handle(keys, 1.0)
+    assert not hero.is_running
+    assert hero.run_counter == 1
+
+    # Simulate multiple frames to reach run threshold
+    for _ in range(hero.run_threshold - 1):
+        handle(keys, 1.0)
+
+    # Should now be running
+    assert hero.is_running
+    assert hero.run_counter == hero.run_threshold
+
+    # Stop running when shift is released
+    keys[K_LSHIFT] = False
+    hero.handle_extended_input(keys, 1.0)
+    assert not hero.is_running
+    assert hero.run_counter == 0
+
+
+def test_running_attack(hero):
+    """Test running attack mechanics"""
+    # Set up for running attack
+    hero.is_running = True
+    hero.is_running_attacking = False
+    hero.is_attacking = False
+
+    # Create mock keys dictionary; X key pressed for running attack
+    keys = {**_BASE_KEYS, K_D: True, K_LSHIFT: True, K_X: True}
+
+    # Perform running attack
+    hero.handle_extended_input(keys, 1.0)
+
+    # Should now be running attacking
+    assert hero.is_running_attacking
+    assert not hero.attack_complete
+    assert len(hero.hit_targets) == 0  # Should be cleared
+
+    # Check hitbox creation
+    hitbox = hero.get_running_attack_hitbox()
+    assert hitbox is not None
+    assert isinstance(hitbox, pygame.Rect)
+
+    # Hitbox should be in front of character for right direction
+    assert hitbox.right > hero.x
+
+    # Check damage calculation; calculate_damage ignores the target, so a
+    # bare attribute bag is all the stub needs
+    mock_target = SimpleNamespace()
+    damage = hero.calculate_running_attack_damage(mock_target)
+    expected_damage = int(10 * hero.running_attack_damage_multiplier)  # 10 is from mock calculate_damage
+    assert damage == expected_damage
+
+    # Check animation state update
+    hero._update_extended_animation_state()
+    assert hero.animation_state == AnimationState.RUNNING_ATTACK
+
+
+def test_animation_state_priorities(hero):
+    """Test animation state priorities"""
+    # Set various states
+    hero.is_running_attacking = True
+    hero.is_jumping = True
+    hero.is_falling = False
+    hero.is_running = True
+
+    # Running attack should have highest priority
+    hero._update_extended_animation_state()
+    assert hero.animation_state == AnimationState.RUNNING_ATTACK
+
+    # Turn off running attack, jumping should be next
+    hero.is_running_attacking = False
+    hero._update_extended_animation_state()
+    assert hero.animation_state == AnimationState.JUMPING
+
+    # Turn off jumping, falling should be next
+    hero.is_jumping = False
+    hero.is_falling = True
+    hero._update_extended_animation_state()
+    assert hero.animation_state == AnimationState.FALLING
+
+    # Turn off falling, running should be next
+    hero.is_falling = False
+    hero._update_extended_animation_state()
+    assert hero.animation_state == AnimationState.RUNNING
+
+
+def test_handle_input_when_dead(hero):
+    """Test that input is ignored when character is dead"""
+    # Set character as dead
+    hero.is_alive = False
+
+    # Create mock keys dictionary with all keys pressed
+    keys = dict.fromkeys(_BASE_KEYS, True)
+
+    # Handle input
+    hero.handle_extended_input(keys, 1.0)
+
+    # No state should change
+    assert not hero.is_jumping
+    assert not hero.is_running
+    assert not hero.is_running_attacking
@@ -0,0 +1,64 @@
+"""Table-driven constructor invariants for goblin, monster and knight.
+
+Replaces the per-file test_initialization copies: each row maps getter
+names to the expected post-construction value, so adding a new character
+is one more row rather than another test function. Requests that tests
+live next to their class keep everything else in the per-class modules.
+"""
+import pytest
+from src.model.Goblin import Goblin
+from src.model.Monster import Monster
+from src.model.knight import Knight
+
+INIT_SPECS = [
+    pytest.param(
+        lambda: Goblin(),
+        {
+            # The class kept its Goblin name through the Gorgon rework,
+            # but the constructed stats are Gorgon's
+            "get_name": "Gorgon",
+            "get_health": 70,
+            "is_boss_monster": False,
+            "get_chance_to_hit": 0.75,
+            "get_damage_range": (8, 12),
+            "get_heal_chance": 0.15,
+            "get_heal_range": (5, 10),
+            "get_special_skill": "Snake Strike",
+            "get_attack_speed": 1.4,
+            "get_movement_speed": 40.0,
+        },
+        id="Goblin",
+    ),
+    pytest.param(
+        lambda: Monster("Test Monster", 100, 20, False),
+        {
+            "get_name": "Test Monster",
+            "get_health": 100,
+            "get_attack_damage": 20,
+            "is_boss_monster": False,
+            "get_chance_to_hit": 1.0,
+            "get_damage_range": (20, 20),
+            "get_heal_chance": 0.0,
+            "get_heal_range": (0, 0),
+        },
+        id="Monster",
+    ),
+    pytest.param(
+        lambda: Knight(100, 200),
+        {
+            "get_x": 100,
+            "get_y": 200,
+            "get_hero_type": "knight",
+            "get_is_alive": True,
+        },
+        id="Knight",
+    ),
+]
+
+
+@pytest.mark.parametrize("make,spec", INIT_SPECS)
+def test_initialization(make, spec):
+    """Test that construction yields the expected getter values"""
+    character = make()
+    for getter, expected in spec.items():
+        assert getattr(character, getter)() == expected, getter
@@ -1,136 +1,129 @@
-import unittest
+import pytest
 from unittest.mock import MagicMock
 from src.model.Monster import Monster
 
+MONSTER_NAME = "Test Monster"
+MONSTER_HEALTH = 100
+ATTACK_DAMAGE = 20
+IS_BOSS = False
 
-class TestMonster(unittest.TestCase):
-    """Tests for the Monster class"""
-
-    def setUp(self):
-        """Set up a monster instance for testing"""
-        self.monster_name = "Test Monster"
-        self.monster_health = 100
-        self.attack_damage = 20
-        self.is_boss = False
-        self.monster = Monster(self.monster_name, self.monster_health, self.attack_damage, self.is_boss)
-
-    def test_initialization(self):
-        """Test that a monster is initialized with correct values"""
-        self.assertEqual(self.monster.get_name(), self.monster_name)
-        self.assertEqual(self.monster.get_health(), self.monster_health)
-        self.assertEqual(self.monster.get_attack_damage(), self.attack_damage)
-        self.assertEqual(self.monster.is_boss_monster(), self.is_boss)
-        
-        # Default values
-        self.assertEqual(self.monster.get_chance_to_hit(), 1.0)
-        damage_range = self.monster.get_damage_range()
-        self.assertEqual(damage_range, (self.attack_damage, self.attack_damage))
-        self.assertEqual(self.monster.get_heal_chance(), 0.0)
-        self.assertEqual(self.monster.get_heal_range(), (0, 0))
-
-    def test_take_damage(self):
-        """Test that monster takes correct damage"""
-        initial_health = self.monster.get_health()
-        damage = 30
-        self.monster.take_damage(damage)
-        
-        expected_health = initial_health - damage
-        self.assertEqual(self.monster.get_health(), expected_health)
-        self.assertTrue(self.monster.is_alive())
-
-    def test_fatal_damage(self):
-        """Test that monster dies when health reaches 0"""
-        # Set up a monster with low health
-        low_health_monster = Monster("Weak Monster", 10, 5, False)
-        
-        # Deal fatal damage
-        low_health_monster.take_damage(15)
-        
-        # Check monster is dead
-        self.assertEqual(low_health_monster.get_health(), -5)
-        self.assertFalse(low_health_monster.is_alive())
-
-    def test_attack(self):
-        """Test monster's attack method"""
-        # Create a mock player
-        mock_player = MagicMock()
-        mock_player.take_damage = MagicMock()
-        
-        # Set 100% chance to hit
-        self.monster.set_chance_to_hit(1.0)
-        
-        # Set a fixed damage range
-        self.monster.set_damage_range(10, 10)
-        
-        # Monster attacks player
-        damage_dealt = self.monster.attack(mock_player)
-        
-        # Verify player's take_damage was called with correct amount
-        self.assertEqual(damage_dealt, 10)
-        mock_player.take_damage.assert_called_once_with(10)
-
-    def test_attack_miss(self):
-        """Test monster's attack when it misses"""
-        # Create a mock player
-        mock_player = MagicMock()
-        
-        # Set 0% chance to hit
-        self.monster.set_chance_to_hit(0.0)
-        
-        # Monster attacks player
-        damage_dealt = self.monster.attack(mock_player)
-        
-        # Verify attack missed
-        self.assertEqual(damage_dealt, 0)
-        mock_player.take_damage.assert_not_called()
-
-    def test_healing(self):
-        """Test monster's healing capability"""
-        # Set up monster with healing ability
-        healing_monster = Monster("Healing Monster", 100, 10, False)
-        healing_monster.set_heal_chance(1.0)  # 100% chance to heal
-        healing_monster.set_heal_range(5, 5)  # Fixed healing amount
-        
-        # Take some damage
-        healing_monster.take_damage(20)
-        # Should be at 80 health
-        
-        # Take more damage to trigger healing
-        # The monster will heal 5 health after taking damage
-        healing_monster.take_damage(10)
-        
-        # Health should be: 100 - 20 - 10 + 5 = 75
-        self.assertEqual(healing_monster.get_health(), 75)
-
-    def test_setting_attributes(self):
-        """Test setter methods for monster attributes"""
-        # Test setting health
-        self.monster.set_health(50)
-        self.assertEqual(self.monster.get_health(), 50)
-        
-        # Test setting chance to hit (with value clamping)
-        self.monster.set_chance_to_hit(1.5)  # Should clamp to 1.0
-        self.assertEqual(self.monster.get_chance_to_hit(), 1.0)
-        
-        self.monster.set_chance_to_hit(-0.5)  # Should clamp to 0.0
-        self.assertEqual(self.monster.get_chance_to_hit(), 0.0)
-        
-        # Test setting damage range
-        self.monster.set_damage_range(15, 25)
-        self.assertEqual(self.monster.get_damage_range(), (15, 25))
-        
-        # Test that max damage can't be less than min damage
-        self.monster.set_damage_range(30, 20)  # Should set both to 30
-        self.assertEqual(self.monster.get_damage_range(), (30, 30))
-        
-        # Test setting heal chance
-        self.monster.set_heal_chance(0.5)
-        self.assertEqual(self.monster.get_heal_chance(), 0.5)
-        
-        # Test setting heal range
-        self.monster.set_heal_range(10, 20)
-        self.assertEqual(self.monster.get_heal_range(), (10, 20))
-
-
-if __name__ == '__main__':
-    unittest.main()
\ No newline at end of file
+
+@pytest.fixture
+def monster():
+    """Monster instance under test"""
+    return Monster(MONSTER_NAME, MONSTER_HEALTH, ATTACK_DAMAGE, IS_BOSS)
+
+
+def test_take_damage(monster):
+    """Test that monster takes correct damage"""
+    initial_health = monster.get_health()
+    damage = 30
+    monster.take_damage(damage)
+
+    assert monster.get_health() == initial_health - damage
+    assert monster.is_alive()
+
+
+def test_fatal_damage():
+    """Test that monster dies when health reaches 0"""
+    # Set up a monster with low health
+    low_health_monster = Monster("Weak Monster", 10, 5, False)
+
+    # Deal fatal damage
+    low_health_monster.take_damage(15)
+
+    # Check monster is dead
+    assert low_health_monster.get_health() == -5
+    assert not low_health_monster.is_alive()
+
+
+@pytest.mark.parametrize("chance_to_hit,expected_damage,expected_calls", [
+    (1.0, 10, [10]),  # Guaranteed hit with a fixed damage range
+    (0.0, 0, []),     # Guaranteed miss leaves the target untouched
+])
+def test_attack(monster, target, chance_to_hit, expected_damage, expected_calls):
+    """Test monster's attack method for both hit and miss outcomes"""
+    monster.set_chance_to_hit(chance_to_hit)
+    monster.set_damage_range(10, 10)
+
+    # Monster attacks player
+    damage_dealt = monster.attack(target)
+
+    # Verify damage dealt and what reached the target
+    assert damage_dealt == expected_damage
+    assert target.calls == expected_calls
+
+
+class _ScriptedRNG:
+    """Replays pre-scripted random()/randint() outcomes in order"""
+
+    def __init__(self, rolls, heal_amounts):
+        self._rolls = iter(rolls)
+        self._heal_amounts = iter(heal_amounts)
+
+    def random(self):
+        return next(self._rolls)
+
+    def randint(self, a, b):
+        return next(self._heal_amounts)
+
+
+@pytest.mark.parametrize("damages,heals,expected_health", [
+    # Each hit gets a heal entry; 0 means the heal roll fails that step
+    ([20, 10], [0, 5], 75),
+    ([50], [10], 60),
+])
+def test_healing(damages, heals, expected_health):
+    """Test monster's healing after damage, one scripted heal per hit"""
+    # Roll 1.0 misses the 0.5 heal chance, roll 0.0 passes it; amounts
+    # come straight from the scripted randint
+    rolls = [1.0 if heal == 0 else 0.0 for heal in heals]
+    rng = _ScriptedRNG(rolls, [heal for heal in heals if heal])
+
+    healing_monster = Monster("Healing Monster", 100, 10, False, rng=rng)
+    healing_monster.set_heal_chance(0.5)
+    healing_monster.set_heal_range(1, 100)
+
+    for damage in damages:
+        healing_monster.take_damage(damage)
+
+    assert healing_monster.get_health() == expected_health
+
+
+def test_set_health(monster):
+    """Test setting health"""
+    monster.set_health(50)
+    assert monster.get_health() == 50
+
+
+@pytest.mark.parametrize("set_val,expected", [
+    (1.5, 1.0),   # Should clamp to 1.0
+    (-0.5, 0.0),  # Should clamp to 0.0
+    (0.5, 0.5),
+])
+def test_set_chance_to_hit_clamp(monster, set_val, expected):
+    """Test setting chance to hit (with value clamping)"""
+    monster.set_chance_to_hit(set_val)
+    assert monster.get_chance_to_hit() == expected
+
+
+@pytest.mark.parametrize("min_dmg,max_dmg,expected", [
+    (15, 25, (15, 25)),
+    (30, 20, (30, 30)),  # Max damage can't be less than min damage
+])
+def test_set_damage_range(monster, min_dmg, max_dmg, expected):
+    """Test setting damage range"""
+    monster.set_damage_range(min_dmg, max_dmg)
+    assert monster.get_damage_range() == expected
+
+
+def test_set_heal_chance(monster):
+    """Test setting heal chance"""
+    monster.set_heal_chance(0.5)
+    assert monster.get_heal_chance() == 0.5
+
+
+def test_set_heal_range(monster):
+    """Test setting heal range"""
+    monster.set_heal_range(10, 20)
+    assert monster.get_heal_range() == (10, 20)
@@ -1,91 +1,112 @@
-import unittest
+import random
+import pytest
 from src.model.MonsterFactory import MonsterFactory, MonsterType
-from src.model.Goblin import Goblin
-from src.model.Ogre import Ogre
-from src.model.Skeleton import Skeleton
-from src.model.DemonBoss import DemonBoss
-
-
-class TestMonsterFactory(unittest.TestCase):
-    """Tests for the MonsterFactory class"""
-
-    def setUp(self):
-        """Set up a monster factory for testing"""
-        self.factory = MonsterFactory()
-
-    def test_supported_types(self):
-        """Test that factory supports expected monster types"""
-        supported_types = self.factory.get_supported_types()
-        
-        # Check that all expected types are supported
-        self.assertIn(MonsterType.GORGON, supported_types)
-        self.assertIn(MonsterType.OGRE, supported_types)
-        self.assertIn(MonsterType.SKELETON, supported_types)
-        self.assertIn(MonsterType.DEMON_BOSS, supported_types)
-
-    def test_create_goblin(self):
-        """Test creation of Goblin monster"""
-        goblin = self.factory.create_monster(MonsterType.GORGON)
-        
-        # Check type
-        self.assertIsInstance(goblin, Goblin)
-        self.assertEqual(goblin.get_name(), "Goblin")
-
-    def test_create_ogre(self):
-        """Test creation of Ogre monster"""
-        ogre = self.factory.create_monster(MonsterType.OGRE)
-        
-        # Check type
-        self.assertIsInstance(ogre, Ogre)
-        self.assertEqual(ogre.get_name(), "Ogre")
-
-    def test_create_skeleton(self):
-        """Test creation of Skeleton monster"""
-        skeleton = self.factory.create_monster(MonsterType.SKELETON)
-        
-        # Check type
-        self.assertIsInstance(skeleton, Skeleton)
-        self.assertEqual(skeleton.get_name(), "Skeleton")
-
-    def test_create_demon_boss(self):
-        """Test creation of Demon Boss monster"""
-        x, y = 100, 200
-        boss = self.factory.create_monster(MonsterType.DEMON_BOSS, x, y)
-        
-        # Check type and position
-        self.assertIsInstance(boss, DemonBoss)
-        self.assertEqual(boss.get_name(), "Demon Boss")
-        self.assertEqual(boss.get_x(), x)
-        self.assertEqual(boss.get_y(), y)
-
-    def test_create_random_monster(self):
-        """Test creation of random monster"""
-        # Create multiple random monsters
-        monsters = [self.factory.create_random_monster() for _ in range(10)]
-        
-        # Verify all are valid monster instances
-        for monster in monsters:
-            self.assertTrue(isinstance(monster, (Goblin, Ogre, Skeleton)))
-            self.assertFalse(isinstance(monster, DemonBoss))  # Boss shouldn't be random
-
-    def test_create_monster_with_custom_stats(self):
-        """Test creation of monster with custom stats"""
-        custom_health = 150
-        goblin = self.factory.create_monster(MonsterType.GORGON, custom_health=custom_health)
-        
-        # Check custom health was applied
-        self.assertEqual(goblin.get_health(), custom_health)
-
-    def test_unsupported_type(self):
-        """Test that creating an unsupported monster type raises an error"""
-        # Create a fake MonsterType that's not supported
-        class FakeMonsterType(MonsterType):
-            FAKE = "fake"
-            
-        # Try to create a monster with unsupported type
-        with self.assertRaises(ValueError):
-            self.factory.create_monster(FakeMonsterType.FAKE)
-
-
-if __name__ == '__main__':
-    unittest.main()
\ No newline at end of file
+
+# Enum members bound once; parametrize tables and assertions skip the
+# EnumMeta attribute lookup on every use
+GORGON, OGRE, SKELETON, DEMON_BOSS = (
+    MonsterType.GORGON, MonsterType.OGRE,
+    MonsterType.SKELETON, MonsterType.DEMON_BOSS,
+)
+
+
+@pytest.fixture(scope="module")
+def factory():
+    """Monster factory under test; module-scoped since no test mutates it"""
+    return MonsterFactory()
+
+
+@pytest.fixture(scope="session")
+def monster_classes():
+    """Concrete monster classes keyed by type, imported on first use so a
+    filtered run does not pay for classes it never touches"""
+    from src.model.Goblin import Goblin
+    from src.model.Ogre import Ogre
+    from src.model.Skeleton import Skeleton
+    from src.model.DemonBoss import DemonBoss
+    return {
+        GORGON: Goblin,
+        OGRE: Ogre,
+        SKELETON: Skeleton,
+        DEMON_BOSS: DemonBoss,
+    }
+
+
+def test_supported_types(factory):
+    """Test that factory supports expected monster types"""
+    # One subset check against the memoized frozenset
+    assert {
+        GORGON,
+        OGRE,
+        SKELETON,
+        DEMON_BOSS,
+    } <= factory.get_supported_types()
+
+
+@pytest.mark.parametrize("monster_type,name", [
+    (GORGON, "Goblin"),
+    (OGRE, "Ogre"),
+    (SKELETON, "Skeleton"),
+])
+def test_create_monster(factory, monster_classes, monster_type, name):
+    """Test creation of each basic monster type"""
+    monster = factory.create_monster(monster_type)
+
+    # Check type
+    assert isinstance(monster, monster_classes[monster_type])
+    assert monster.get_name() == name
+
+
+def test_create_demon_boss(factory, monster_classes):
+    """Test creation of Demon Boss monster"""
+    x, y = 100, 200
+    boss = factory.create_monster(DEMON_BOSS, x, y)
+
+    # Check type and position
+    assert isinstance(boss, monster_classes[DEMON_BOSS])
+    assert boss.get_name() == "Demon Boss"
+    assert boss.get_x() == x
+    assert boss.get_y() == y
+
+
+@pytest.mark.parametrize("seed", range(10))
+def test_create_random_monster(factory, monster_classes, seed, monkeypatch):
+    """Test creation of random monster across seeded draws"""
+    # Seed each draw so every case is reproducible and reported on its own
+    monkeypatch.setattr(random, "choice", random.Random(seed).choice)
+    monster = factory.create_random_monster()
+
+    # Verify it is a valid non-boss monster instance
+    basic_classes = tuple(
+        cls for mtype, cls in monster_classes.items()
+        if mtype is not DEMON_BOSS
+    )
+    assert isinstance(monster, basic_classes)
+    assert not isinstance(monster, monster_classes[DEMON_BOSS])
+
+
+@pytest.mark.parametrize("monster_type", [
+    GORGON,
+    OGRE,
+    SKELETON,
+])
+def test_create_monster_with_custom_stats(factory, monster_type):
+    """Test creation of each basic monster type with custom stats"""
+    custom_health = 150
+    monster = factory.create_monster(monster_type, custom_health=custom_health)
+
+    # Check custom health was applied
+    assert monster.get_health() == custom_health
+
+
+def test_unsupported_type(factory):
+    """Test that creating an unsupported monster type raises an error"""
+    # The fake type has to be declared here: a MonsterType subclass at
+    # module scope would raise at import since the enum already has
+    # members, killing collection for the whole file
+    class FakeMonsterType(MonsterType):
+        FAKE = "fake"
+
+    # Try to create a monster with unsupported type
+    with pytest.raises(ValueError):
+        factory.create_monster(FakeMonsterType.FAKE)
@@ -1,110 +1,137 @@
-import unittest
-from unittest.mock import MagicMock, patch
+import pytest
+from unittest.mock import DEFAULT, create_autospec, patch
+from src.model.DungeonHero import Hero
 from src.model.Ogre import Ogre
 
+# Optional-capability flags computed once at import; the skip markers
+# below read these instead of re-running hasattr per test
+HAS_RAGE = hasattr(Ogre, "is_enraged")
+HAS_SPECIAL_ATTACK = hasattr(Ogre, "special_attack")
+HAS_STRENGTH = hasattr(Ogre, "get_strength")
 
-class TestOgre(unittest.TestCase):
-    """Tests for the Ogre class"""
-
-    def setUp(self):
-        """Set up an Ogre instance for testing"""
-        self.ogre = Ogre()
-
-    def test_initialization(self):
-        """Test that an ogre is initialized with correct values"""
-        self.assertEqual(self.ogre.get_name(), "Ogre")
-        self.assertGreater(self.ogre.get_health(), 0)
-        self.assertFalse(self.ogre.is_boss_monster())
-        
-        # Ogre specific values
-        self.assertGreater(self.ogre.get_chance_to_hit(), 0)
-        min_damage, max_damage = self.ogre.get_damage_range()
-        self.assertGreater(max_damage, min_damage)  # Damage range should be valid
-        
-        # Ogre should have some specific attributes
-        if hasattr(self.ogre, "get_strength"):
-            self.assertGreater(self.ogre.get_strength(), 0)
-
-    def test_attack(self):
-        """Test ogre's attack method"""
-        # Create a mock player
-        mock_player = MagicMock()
-        mock_player.take_damage = MagicMock()
-        
-        # Mock random.random to guarantee a hit
-        with patch('random.random', return_value=0.1):
-            # Mock random.randint to get consistent damage
-            with patch('random.randint', return_value=30):
-                # Ogre attacks player
-                damage_dealt = self.ogre.attack(mock_player)
-                
-                # Verify damage
-                self.assertEqual(damage_dealt, 30)
-                mock_player.take_damage.assert_called_once_with(30)
-
-    def test_attack_miss(self):
-        """Test ogre's attack when it misses"""
-        # Create a mock player
-        mock_player = MagicMock()
-        mock_player.take_damage = MagicMock()
-        
-        # Mock random.random to guarantee a miss (hit chance should be < 1.0)
-        with patch('random.random', return_value=0.99):
-            # Ogre attacks player
-            damage_dealt = self.ogre.attack(mock_player)
-            
-            # Verify attack missed
-            self.assertEqual(damage_dealt, 0)
-            mock_player.take_damage.assert_not_called()
-
-    def test_take_damage_and_rage(self):
-        """Test ogre taking damage and potentially entering rage state"""
-        initial_health = self.ogre.get_health()
-        
-        # Take damage
-        self.ogre.take_damage(initial_health // 2)
-        
-        # Check rage state if applicable
-        if hasattr(self.ogre, "is_enraged"):
-            # Ogre might be enraged after taking significant damage
-            enraged = self.ogre.is_enraged()
-            
-            # If enraged, damage should be boosted
-            if enraged and hasattr(self.ogre, "get_damage_range"):
-                min_damage, max_damage = self.ogre.get_damage_range()
-                self.assertGreater(min_damage, 0)  # Damage should be positive
-        
-        # Test that ogre is still alive
-        self.assertTrue(self.ogre.is_alive())
-
-    def test_special_attack(self):
-        """Test ogre's special attack if available"""
-        if hasattr(self.ogre, "special_attack"):
-            # Create a mock player
-            mock_player = MagicMock()
-            mock_player.take_damage = MagicMock()
-            
-            # Use special attack
-            damage = self.ogre.special_attack(mock_player)
-            
-            # Verify damage is positive
-            self.assertGreaterEqual(damage, 0)
-            
-            # Verify player took damage if attack hit
-            if damage > 0:
-                mock_player.take_damage.assert_called_once_with(damage)
-
-    def test_string_representation(self):
-        """Test the string representation of the ogre"""
-        ogre_str = str(self.ogre)
-        
-        # Check that string contains important information
-        self.assertIn("Ogre", ogre_str)
-        
-        # Check for specific ogre attributes in string
-        if hasattr(self.ogre, "get_strength"):
-            self.assertIn(str(self.ogre.get_strength()), ogre_str)
-
-
-if __name__ == '__main__':
-    unittest.main()
\ No newline at end of file
+
+@pytest.fixture(scope="module")
+def pristine_ogre():
+    """Single ogre shared by tests that never mutate it"""
+    return Ogre()
+
+
+# Small pool backing the mutable fixture; instances are reset on reuse
+# instead of paying the constructor again
+_OGRE_POOL = []
+
+
+@pytest.fixture
+def ogre():
+    """Pooled ogre for tests that mutate state, reset between borrows"""
+    if _OGRE_POOL:
+        pooled = _OGRE_POOL.pop()
+        pooled.reset()
+    else:
+        pooled = Ogre()
+    yield pooled
+    _OGRE_POOL.append(pooled)
+
+
+@pytest.fixture(scope="session")
+def _mock_player_template():
+    """One spec'd hero stand-in per session; the autospec walk over Hero
+    is paid once instead of per test"""
+    return create_autospec(Hero, instance=True)
+
+
+@pytest.fixture
+def mock_player(_mock_player_template):
+    """Per-test view of the shared player mock with call history cleared"""
+    _mock_player_template.reset_mock()
+    return _mock_player_template
+
+
+def test_initialization(pristine_ogre):
+    """Test that an ogre is initialized with correct values"""
+    ogre = pristine_ogre
+    assert ogre.get_name() == "Ogre"
+    assert ogre.get_health() > 0
+    assert not ogre.is_boss_monster()
+
+    # Ogre specific values
+    assert ogre.get_chance_to_hit() > 0
+    min_damage, max_damage = ogre.get_damage_range()
+    assert max_damage > min_damage  # Damage range should be valid
+
+
+@pytest.mark.skipif(not HAS_STRENGTH,
+                    reason="Ogre has no strength stat")
+def test_strength(pristine_ogre):
+    """Test that the ogre's strength stat is positive"""
+    assert pristine_ogre.get_strength() > 0
+
+
+@pytest.mark.parametrize("rand_value,expected_damage,expected_calls", [
+    (0.1, 30, [30]),  # Roll under the hit chance lands the fixed damage
+    (0.99, 0, []),    # Roll above the hit chance misses entirely
+])
+def test_attack(pristine_ogre, target, rand_value, expected_damage, expected_calls):
+    """Test ogre's attack method for both hit and miss outcomes"""
+    # One patch.multiple context covers both rolls: random.random decides
+    # the hit, random.randint the damage
+    with patch.multiple('random', random=DEFAULT, randint=DEFAULT) as mocks:
+        mocks['random'].return_value = rand_value
+        mocks['randint'].return_value = 30
+        damage_dealt = pristine_ogre.attack(target)
+
+    # Verify damage dealt and what reached the target
+    assert damage_dealt == expected_damage
+    assert target.calls == expected_calls
+
+
+def test_take_damage(ogre):
+    """Test ogre taking damage and surviving a non-fatal hit"""
+    initial_health = ogre.get_health()
+
+    # Take damage
+    ogre.take_damage(initial_health // 2)
+
+    # Test that ogre is still alive
+    assert ogre.is_alive()
+
+
+@pytest.mark.skipif(not HAS_RAGE,
+                    reason="Ogre has no rage state")
+def test_rage_damage_boost(ogre):
+    """Test ogre's rage state after taking significant damage"""
+    initial_health = ogre.get_health()
+    ogre.take_damage(initial_health // 2)
+
+    # If enraged, damage should be boosted
+    if ogre.is_enraged():
+        min_damage, _ = ogre.get_damage_range()
+        assert min_damage > 0  # Damage should be positive
+
+
+@pytest.mark.skipif(not HAS_SPECIAL_ATTACK,
+                    reason="Ogre has no special attack")
+def test_special_attack(pristine_ogre, mock_player):
+    """Test ogre's special attack"""
+    # Use special attack
+    damage = pristine_ogre.special_attack(mock_player)
+
+    # Verify damage is positive
+    assert damage >= 0
+
+    # Verify player took damage if attack hit
+    if damage > 0:
+        mock_player.take_damage.assert_called_once_with(damage)
+
+
+def test_string_representation(pristine_ogre):
+    """Test the string representation of the ogre"""
+    # Check that string contains important information
+    assert "Ogre" in str(pristine_ogre)
+
+
+@pytest.mark.skipif(not HAS_STRENGTH,
+                    reason="Ogre has no strength stat")
+def test_string_contains_strength(pristine_ogre):
+    """Test that strength appears in the string representation"""
+    assert str(pristine_ogre.get_strength()) in str(pristine_ogre)
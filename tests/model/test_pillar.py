@@ -0,0 +1,124 @@
+import pygame
+import pytest
+from src.model.Pillar import Pillar, PillarManager, PillarType
+
+# pygame-touching tests share one xdist worker so SDL state never races
+pytestmark = pytest.mark.xdist_group(name="pygame")
+
+PILLAR_X, PILLAR_Y = 100, 200
+
+# Materialized once; every list(PillarType) call walks the enum
+# metaclass to build a fresh list
+_PILLAR_TYPES = list(PillarType)
+
+# Collision rects built once at import; no test mutates them, so the
+# same instances serve every case
+_COLLIDING_RECT = pygame.Rect(110, 210, 20, 20)
+_NON_COLLIDING_RECT = pygame.Rect(200, 300, 20, 20)
+
+# Expected base color per pillar type, mirroring the table in Pillar
+_EXPECTED_COLORS = {
+    PillarType.ENCAPSULATION: (100, 150, 200),
+    PillarType.INHERITANCE: (200, 100, 150),
+    PillarType.POLYMORPHISM: (150, 200, 100),
+    PillarType.ABSTRACTION: (200, 150, 100),
+    PillarType.COMPOSITION: (150, 100, 200),
+}
+
+
+@pytest.fixture
+def pillar():
+    """Fresh pillar for tests that mutate collection state"""
+    return Pillar(PillarType.ENCAPSULATION, PILLAR_X, PILLAR_Y)
+
+
+@pytest.fixture
+def manager():
+    """Fresh pillar manager for collection tests"""
+    return PillarManager()
+
+
+def test_initialization(pillar):
+    """Test pillar initialization"""
+    assert pillar.pillar_type is PillarType.ENCAPSULATION
+    assert pillar.name == "Encapsulation"
+    assert pillar.x == PILLAR_X
+    assert pillar.y == PILLAR_Y
+    assert not pillar.is_collected
+
+
+@pytest.mark.parametrize("pillar_type,expected", [
+    (PillarType.ENCAPSULATION, "Encapsulation"),
+    (PillarType.INHERITANCE, "Inheritance"),
+    (PillarType.POLYMORPHISM, "Polymorphism"),
+    (PillarType.ABSTRACTION, "Abstraction"),
+    (PillarType.COMPOSITION, "Composition"),
+])
+def test_pillar_type_values(pillar_type, expected):
+    """Test each pillar type's display value"""
+    assert pillar_type.value == expected
+
+
+@pytest.mark.parametrize("pillar_type", _PILLAR_TYPES)
+def test_pillar_colors(pillar_type):
+    """Test that each pillar type gets its own base color"""
+    # One parametrized case per type instead of building all five
+    # pillars inside a single test body
+    built = Pillar(pillar_type, PILLAR_X, PILLAR_Y)
+    assert built._Pillar__base_color == _EXPECTED_COLORS[pillar_type]
+
+
+def test_collect(pillar):
+    """Test collecting a pillar exactly once"""
+    assert pillar.collect()
+    assert pillar.is_collected
+
+    # Second collection attempt is rejected
+    assert not pillar.collect()
+
+
+def test_check_collision(pillar):
+    """Test collision detection against the pillar rectangle"""
+    assert pillar.check_collision(_COLLIDING_RECT)
+    assert not pillar.check_collision(_NON_COLLIDING_RECT)
+
+    # Collected pillars no longer collide
+    pillar.collect()
+    assert not pillar.check_collision(_COLLIDING_RECT)
+
+
+def test_boss_room_access(manager):
+    """Test the four-pillar boss room threshold"""
+    room_pos = (0, 0)
+
+    # Batch-add all five pillars upfront, spaced so each collection
+    # rect touches exactly one of them
+    pillars = [
+        Pillar(pillar_type, i * 100, PILLAR_Y)
+        for i, pillar_type in enumerate(_PILLAR_TYPES)
+    ]
+    for built in pillars:
+        manager.add_pillar_to_room(room_pos, built)
+
+    for i, built in enumerate(pillars):
+        assert manager.check_pillar_collection(room_pos, built.rect) is built
+
+        # Only the boundary transitions matter: three pillars is still
+        # short of the threshold, four opens the boss room
+        if i == 2:
+            assert not manager.can_access_boss_room()
+        elif i == 3:
+            assert manager.can_access_boss_room()
+
+
+def test_pillar_collection_tracking(manager, pillar):
+    """Test manager tracking of spawned and collected pillars"""
+    room_pos = (0, 0)
+    manager.add_pillar_to_room(room_pos, pillar)
+    assert manager.total_count == 1
+    assert manager.collected_count == 0
+
+    collected = manager.check_pillar_collection(room_pos, _COLLIDING_RECT)
+    assert collected is pillar
+    assert manager.collected_count == 1
+    assert manager.has_collected(PillarType.ENCAPSULATION)
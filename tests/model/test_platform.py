@@ -1,25 +1,33 @@
 import unittest
+import pytest
 import pygame
 from src.model.Platform import Platform
 
+# pygame-touching tests share one xdist worker so SDL state never races
+pytestmark = pytest.mark.xdist_group(name="pygame")
+
 
 class TestPlatform(unittest.TestCase):
     """Tests for the Platform class"""
 
+    @classmethod
+    def setUpClass(cls):
+        """Initialize pygame once for the whole class"""
+        pygame.init()
+
+    @classmethod
+    def tearDownClass(cls):
+        """Clean up pygame"""
+        pygame.quit()
+
     def setUp(self):
         """Set up test environment"""
-        pygame.init()
-        
         # Create platforms of different types
         self.normal_platform = Platform(100, 200, 200, 20, "normal")
         self.moving_platform = Platform(300, 400, 100, 20, "moving")
         self.breakable_platform = Platform(500, 300, 150, 20, "breakable")
         self.one_way_platform = Platform(700, 500, 200, 10, "one-way")
 
-    def tearDown(self):
-        """Clean up pygame"""
-        pygame.quit()
-
     def test_initialization(self):
         """Test platform initialization"""
         # Test normal platform
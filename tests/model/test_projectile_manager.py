@@ -1,18 +1,29 @@
 import unittest
+import pytest
 from unittest.mock import MagicMock, patch
 import pygame
 from src.model.ProjectileManager import ProjectileManager, Projectile, ProjectileType
 from src.model.DungeonEntity import Direction
 
+# pygame-touching tests share one xdist worker so SDL state never races
+pytestmark = pytest.mark.xdist_group(name="pygame")
+
 
 class TestProjectileManager(unittest.TestCase):
     """Tests for the ProjectileManager class"""
 
+    @classmethod
+    def setUpClass(cls):
+        """Initialize pygame once for Surface operations"""
+        pygame.init()
+
+    @classmethod
+    def tearDownClass(cls):
+        """Clean up pygame"""
+        pygame.quit()
+
     def setUp(self):
         """Set up ProjectileManager for testing"""
-        # Initialize pygame for Surface operations
-        pygame.init()
-        
         # Create a mock screen
         self.screen_width = 800
         self.screen_height = 600
@@ -38,10 +49,6 @@ class TestProjectileManager(unittest.TestCase):
             range=300
         )
 
-    def tearDown(self):
-        """Clean up pygame"""
-        pygame.quit()
-
     def test_add_projectile(self):
         """Test adding a projectile to the manager"""
         # Initial count should be 0
@@ -1,4 +1,5 @@
 import unittest
+import pytest
 from unittest.mock import MagicMock, patch
 import pygame
 import os
@@ -8,14 +9,26 @@ from src.model.RoomDungeonSystem import (
     DoorType, Direction, DoorInteractionState
 )
 
+# pygame-touching tests share one xdist worker so SDL state never races
+pytestmark = pytest.mark.xdist_group(name="pygame")
+
+
 
 class TestFloorRenderer(unittest.TestCase):
     """Tests for the FloorRenderer class"""
 
+    @classmethod
+    def setUpClass(cls):
+        """Initialize pygame once for the whole class"""
+        pygame.init()
+
+    @classmethod
+    def tearDownClass(cls):
+        """Clean up pygame"""
+        pygame.quit()
+
     def setUp(self):
         """Set up test environment"""
-        pygame.init()
-        
         # Create a temporary CSV file for testing
         self.temp_dir = tempfile.mkdtemp()
         self.csv_path = os.path.join(self.temp_dir, "test_pattern.csv")
@@ -32,7 +45,6 @@ class TestFloorRenderer(unittest.TestCase):
         """Clean up temporary files"""
         os.remove(self.csv_path)
         os.rmdir(self.temp_dir)
-        pygame.quit()
 
     def test_initialization(self):
         """Test floor renderer initialization"""
@@ -68,10 +80,18 @@ class TestFloorRenderer(unittest.TestCase):
 class TestDoor(unittest.TestCase):
     """Tests for the Door class"""
 
+    @classmethod
+    def setUpClass(cls):
+        """Initialize pygame once for the whole class"""
+        pygame.init()
+
+    @classmethod
+    def tearDownClass(cls):
+        """Clean up pygame"""
+        pygame.quit()
+
     def setUp(self):
         """Set up test environment"""
-        pygame.init()
-        
         # Door parameters
         self.direction = Direction.UP
         self.dest_room = (1, 2)  # Grid coordinates
@@ -93,10 +113,6 @@ class TestDoor(unittest.TestCase):
         # Calculate position for the door in a room
         self.door._Door__calculate_door_position(self.room_width, self.room_height)
 
-    def tearDown(self):
-        """Clean up pygame"""
-        pygame.quit()
-
     def test_initialization(self):
         """Test door initialization"""
         self.assertEqual(self.door.direction, self.direction)
@@ -175,10 +191,18 @@ class TestDoor(unittest.TestCase):
 class TestRoom(unittest.TestCase):
     """Tests for the Room class"""
 
+    @classmethod
+    def setUpClass(cls):
+        """Initialize pygame once for the whole class"""
+        pygame.init()
+
+    @classmethod
+    def tearDownClass(cls):
+        """Clean up pygame"""
+        pygame.quit()
+
     def setUp(self):
         """Set up test environment"""
-        pygame.init()
-        
         # Room parameters
         self.grid_pos = (0, 0)
         self.width = 800
@@ -188,10 +212,6 @@ class TestRoom(unittest.TestCase):
         # Create a room
         self.room = Room(self.grid_pos, self.width, self.height, self.tile_size)
 
-    def tearDown(self):
-        """Clean up pygame"""
-        pygame.quit()
-
     def test_initialization(self):
         """Test room initialization"""
         self.assertEqual(self.room.grid_pos(), self.grid_pos)
@@ -296,10 +316,18 @@ class TestRoom(unittest.TestCase):
 class TestDungeonManager(unittest.TestCase):
     """Tests for the DungeonManager class"""
 
+    @classmethod
+    def setUpClass(cls):
+        """Initialize pygame once for the whole class"""
+        pygame.init()
+
+    @classmethod
+    def tearDownClass(cls):
+        """Clean up pygame"""
+        pygame.quit()
+
     def setUp(self):
         """Set up test environment"""
-        pygame.init()
-        
         # Create a dungeon manager
         self.grid_width = 3
         self.grid_height = 3
@@ -315,10 +343,6 @@ class TestDungeonManager(unittest.TestCase):
                 self.tile_size
             )
 
-    def tearDown(self):
-        """Clean up pygame"""
-        pygame.quit()
-
     def test_initialization(self):
         """Test dungeon manager initialization"""
         # Should create a grid of rooms
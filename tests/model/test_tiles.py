@@ -1,31 +1,45 @@
 import unittest
+import pytest
 from unittest.mock import MagicMock, patch, mock_open
 import os
 import pygame
 import csv
 from src.model.tiles import Tile, TileMap  # Adjust import based on your actual class structure
 
+# pygame-touching tests share one xdist worker so SDL state never races
+pytestmark = pytest.mark.xdist_group(name="pygame")
+
+# Prototype mocks built once at import; tests clear their call history
+# with reset_mock instead of paying MagicMock construction per test
+_PROTO_SPRITESHEET = MagicMock()
+_PROTO_SPRITESHEET.get_image.return_value = pygame.Surface((32, 32))
+_PROTO_SCREEN = MagicMock()
+
 
 class TestTile(unittest.TestCase):
     """Tests for the Tile class"""
 
+    @classmethod
+    def setUpClass(cls):
+        """Initialize pygame once for the whole class"""
+        pygame.init()
+
+    @classmethod
+    def tearDownClass(cls):
+        """Clean up pygame"""
+        pygame.quit()
+
     def setUp(self):
         """Set up test environment"""
-        pygame.init()
-        
-        # Create a mock spritesheet
-        self.mock_spritesheet = MagicMock()
-        self.mock_spritesheet.get_image = MagicMock(return_value=pygame.Surface((32, 32)))
-        
+        # Reuse the shared spritesheet prototype with history cleared
+        self.mock_spritesheet = _PROTO_SPRITESHEET
+        self.mock_spritesheet.reset_mock()
+
         # Create a tile
         self.x, self.y = 100, 200
         self.tile_name = "ground.png"
         self.tile = Tile(self.tile_name, self.x, self.y, self.mock_spritesheet)
 
-    def tearDown(self):
-        """Clean up pygame"""
-        pygame.quit()
-
     def test_initialization(self):
         """Test tile initialization"""
         self.assertEqual(self.tile.x, self.x)
@@ -56,10 +70,10 @@ class TestTile(unittest.TestCase):
 
     def test_draw(self):
         """Test tile draw method"""
-        # Create mock screen
-        mock_screen = MagicMock()
-        mock_screen.blit = MagicMock()
-        
+        # Reuse the shared screen prototype with history cleared
+        mock_screen = _PROTO_SCREEN
+        mock_screen.reset_mock()
+
         # Draw tile
         self.tile.draw(mock_screen)
         
@@ -70,22 +84,26 @@ class TestTile(unittest.TestCase):
 class TestTileMap(unittest.TestCase):
     """Tests for the TileMap class"""
 
+    @classmethod
+    def setUpClass(cls):
+        """Initialize pygame once for the whole class"""
+        pygame.init()
+
+    @classmethod
+    def tearDownClass(cls):
+        """Clean up pygame"""
+        pygame.quit()
+
     def setUp(self):
         """Set up test environment"""
-        pygame.init()
-        
-        # Create a mock spritesheet
-        self.mock_spritesheet = MagicMock()
-        self.mock_spritesheet.get_image = MagicMock(return_value=pygame.Surface((32, 32)))
-        
+        # Reuse the shared spritesheet prototype with history cleared
+        self.mock_spritesheet = _PROTO_SPRITESHEET
+        self.mock_spritesheet.reset_mock()
+
         # Create a tilemap
         self.tile_size = 32
         self.tilemap = TileMap(self.tile_size, self.mock_spritesheet)
 
-    def tearDown(self):
-        """Clean up pygame"""
-        pygame.quit()
-
     def test_initialization(self):
         """Test tilemap initialization"""
         self.assertEqual(self.tilemap.tile_size, self.tile_size)
@@ -153,9 +171,10 @@ class TestTileMap(unittest.TestCase):
             Tile("ground.png", 0, 32, self.mock_spritesheet)
         ]
         
-        # Create mock screen
-        mock_screen = MagicMock()
-        
+        # Reuse the shared screen prototype with history cleared
+        mock_screen = _PROTO_SCREEN
+        mock_screen.reset_mock()
+
         # Draw tiles
         self.tilemap.draw_map(mock_screen, tiles)
         